@@ -8,42 +8,49 @@ Usage:
     # From installed package
     python -m biglinux_swap
 
-    # Direct execution (development)
-    cd src/biglinux_swap
-    python __init__.py
+    # From a source checkout (development)
+    cd src
+    python -m biglinux_swap
 """
 
-import sys
-from pathlib import Path
+import importlib
+from typing import TYPE_CHECKING
 
 __author__ = "BigLinux Team"
 __license__ = "GPL-3.0"
 
-# Support direct execution without installation
-# Add parent directory to path so imports work
-_current_file = Path(__file__).resolve()
-_package_dir = _current_file.parent
-_src_dir = _package_dir.parent
-
-if str(_src_dir) not in sys.path:
-    sys.path.insert(0, str(_src_dir))
-
-from biglinux_swap.application import SwapApplication
-from biglinux_swap.config import (
-    APP_ID,
-    APP_NAME,
-    APP_VERSION,
-    Compressor,
-    MglruTtl,
-    SwapConfig,
-    SwapFileConfig,
-    SwapMode,
-    ZramConfig,
-    ZswapConfig,
-)
-from biglinux_swap.main import main
+if TYPE_CHECKING:
+    from biglinux_swap.application import SwapApplication
+    from biglinux_swap.config import (
+        APP_ID,
+        APP_NAME,
+        APP_VERSION,
+        Compressor,
+        MglruTtl,
+        SwapConfig,
+        SwapFileConfig,
+        SwapMode,
+        ZramConfig,
+        ZswapConfig,
+    )
+    from biglinux_swap.main import main
 
-__version__ = APP_VERSION
+# Public names resolved on first access (PEP 562): name -> (module, attribute)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "APP_ID": ("biglinux_swap.config", "APP_ID"),
+    "APP_NAME": ("biglinux_swap.config", "APP_NAME"),
+    "APP_VERSION": ("biglinux_swap.config", "APP_VERSION"),
+    "Compressor": ("biglinux_swap.config", "Compressor"),
+    "MglruTtl": ("biglinux_swap.config", "MglruTtl"),
+    "SwapApplication": ("biglinux_swap.application", "SwapApplication"),
+    "SwapConfig": ("biglinux_swap.config", "SwapConfig"),
+    "SwapFileConfig": ("biglinux_swap.config", "SwapFileConfig"),
+    "SwapMode": ("biglinux_swap.config", "SwapMode"),
+    "ZramConfig": ("biglinux_swap.config", "ZramConfig"),
+    "ZswapConfig": ("biglinux_swap.config", "ZswapConfig"),
+    "main": ("biglinux_swap.main", "main"),
+    "__version__": ("biglinux_swap.config", "APP_VERSION"),
+}
 
 __all__ = [
     "APP_ID",
@@ -62,5 +69,12 @@ __all__ = [
 ]
 
 
-if __name__ == "__main__":
-    sys.exit(main())
+def __getattr__(name: str) -> object:
+    """Import public names lazily so the package import stays cheap."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+GObject Introspection bootstrap for BigLinux Swap Manager.
+
+Pins the typelib versions once and re-exports the repository modules,
+so every other module imports them from here instead of repeating the
+gi.require_version calls.
+"""
+
+import gi
+
+gi.require_version("GLib", "2.0")
+gi.require_version("Gtk", "4.0")
+gi.require_version("Gdk", "4.0")
+gi.require_version("Adw", "1")
+from gi.repository import Adw, Gdk, Gio, GLib, Gtk
+
+__all__ = ["Adw", "Gdk", "Gio", "GLib", "Gtk"]
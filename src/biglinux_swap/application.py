@@ -8,23 +8,33 @@ Adwaita Application with lazy service initialization.
 from __future__ import annotations
 
 import logging
+from functools import cache, cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gdk, Gio, GLib, Gtk
+from biglinux_swap._gi_bootstrap import Adw, Gdk, Gio, GLib, Gtk
 
 from biglinux_swap.config import APP_ID, APP_NAME, APP_VERSION
 from biglinux_swap.i18n import _
-from biglinux_swap.services import ConfigService, MeminfoService, SwapService
-from biglinux_swap.ui.welcome_dialog import WelcomeDialog
-from biglinux_swap.window import SwapWindow
 
+if TYPE_CHECKING:
+    from biglinux_swap.services import ConfigService, MeminfoService, SwapService
+    from biglinux_swap.window import SwapWindow
 
 logger = logging.getLogger(__name__)
 
+# Static translated strings (the locale is fixed for the process lifetime)
+_ABOUT_COMMENT = _("Configure swap settings for optimal performance")
+
+
+@cache
+def _local_icon_search_path() -> Path | None:
+    """Return the source tree icon directory, or None if it doesn't exist."""
+    icon_path = (
+        Path(__file__).resolve().parent.parent.parent / "usr" / "share" / "icons"
+    )
+    return icon_path if icon_path.exists() else None
+
 
 class SwapApplication(Adw.Application):
     """
@@ -34,6 +44,20 @@ class SwapApplication(Adw.Application):
     the application lifecycle.
     """
 
+    # Plain Python-side references live in slots; the GObject base keeps its
+    # __dict__, which the cached_property services below still rely on
+    __slots__ = ("_about_dialog", "_window")
+
+    # Application actions: (name, handler method, keyboard accelerators)
+    _ACTIONS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+        ("quit", "_on_quit", ("<primary>q",)),
+        ("about", "_on_about", ()),
+        ("apply-config", "_on_apply_config", ()),
+        ("refresh", "_on_refresh", ("F5",)),
+        ("welcome", "_on_welcome", ()),
+        ("restore_defaults", "_on_restore_defaults", ()),
+    )
+
     def __init__(self) -> None:
         """Initialize the application."""
         super().__init__(
@@ -41,90 +65,68 @@ class SwapApplication(Adw.Application):
             flags=Gio.ApplicationFlags.DEFAULT_FLAGS,
         )
 
-        # Services (lazy-initialized)
-        self._config_service: ConfigService | None = None
-        self._meminfo_service: MeminfoService | None = None
-        self._swap_service: SwapService | None = None
-
         # Window reference
         self._window: SwapWindow | None = None
 
-    @property
+        # About dialog (built on first use)
+        self._about_dialog: Adw.AboutDialog | None = None
+
+    @cached_property
     def config_service(self) -> ConfigService:
         """Lazy-initialized config service."""
-        if self._config_service is None:
-            self._config_service = ConfigService()
-        return self._config_service
+        from biglinux_swap.services import ConfigService
+
+        return ConfigService()
 
-    @property
+    @cached_property
     def meminfo_service(self) -> MeminfoService:
         """Lazy-initialized meminfo service."""
-        if self._meminfo_service is None:
-            self._meminfo_service = MeminfoService()
-        return self._meminfo_service
+        from biglinux_swap.services import MeminfoService
 
-    @property
+        return MeminfoService()
+
+    @cached_property
     def swap_service(self) -> SwapService:
         """Lazy-initialized swap service."""
-        if self._swap_service is None:
-            self._swap_service = SwapService()
-        return self._swap_service
+        from biglinux_swap.services import SwapService
+
+        return SwapService()
 
     def do_startup(self) -> None:
         """Handle application startup."""
         Adw.Application.do_startup(self)
 
-        # Register local icons if available (for development/local execution)
-        project_root = Path(__file__).resolve().parent.parent.parent
-        icon_path = project_root / "usr" / "share" / "icons"
-        if icon_path.exists():
-            display = Gdk.Display.get_default()
-            if display:
-                theme = Gtk.IconTheme.get_for_display(display)
-                theme.add_search_path(str(icon_path))
+        # Register local icons if available (for development/local execution),
+        # once the window is up so the icon theme rescan stays off startup
+        if _local_icon_search_path() is not None:
+            GLib.idle_add(self._register_local_icons, priority=GLib.PRIORITY_LOW)
 
         # Set up application actions
         self._setup_actions()
 
-        logger.debug("Application started")
+    def _register_local_icons(self) -> bool:
+        """Add the source tree icon directory to the icon theme search path."""
+        icon_path = _local_icon_search_path()
+        display = Gdk.Display.get_default()
+        if icon_path is not None and display:
+            theme = Gtk.IconTheme.get_for_display(display)
+            theme.add_search_path(str(icon_path))
+        return GLib.SOURCE_REMOVE
 
     def _setup_actions(self) -> None:
         """Set up application actions."""
-        # Quit action
-        quit_action = Gio.SimpleAction.new("quit", None)
-        quit_action.connect("activate", self._on_quit)
-        self.add_action(quit_action)
-        self.set_accels_for_action("app.quit", ["<primary>q"])
-
-        # About action
-        about_action = Gio.SimpleAction.new("about", None)
-        about_action.connect("activate", self._on_about)
-        self.add_action(about_action)
-
-        # Apply action
-        apply_action = Gio.SimpleAction.new("apply-config", None)
-        apply_action.connect("activate", self._on_apply_config)
-        self.add_action(apply_action)
-
-        # Refresh action
-        refresh_action = Gio.SimpleAction.new("refresh", None)
-        refresh_action.connect("activate", self._on_refresh)
-        self.add_action(refresh_action)
-        self.set_accels_for_action("app.refresh", ["F5"])
-
-        # Welcome action
-        welcome_action = Gio.SimpleAction.new("welcome", None)
-        welcome_action.connect("activate", self._on_welcome)
-        self.add_action(welcome_action)
-
-        # Restore defaults action
-        restore_defaults_action = Gio.SimpleAction.new("restore_defaults", None)
-        restore_defaults_action.connect("activate", self._on_restore_defaults)
-        self.add_action(restore_defaults_action)
+        for name, handler, accels in self._ACTIONS:
+            action = Gio.SimpleAction.new(name, None)
+            action.connect("activate", getattr(self, handler))
+            self.add_action(action)
+            if accels:
+                self.set_accels_for_action(f"app.{name}", list(accels))
 
     def do_activate(self) -> None:
         """Handle application activation."""
         if not self._window:
+            from biglinux_swap.window import SwapWindow
+
             self._window = SwapWindow(
                 application=self,
                 config_service=self.config_service,
@@ -132,6 +134,8 @@ class SwapApplication(Adw.Application):
                 swap_service=self.swap_service,
             )
             # Show welcome dialog on first run
+            from biglinux_swap.ui.welcome_dialog import WelcomeDialog
+
             if WelcomeDialog.should_show_welcome():
                 welcome = WelcomeDialog(self._window)
                 welcome.present()
@@ -140,11 +144,10 @@ class SwapApplication(Adw.Application):
 
     def do_shutdown(self) -> None:
         """Handle application shutdown."""
-        # Stop meminfo monitoring
-        if self._meminfo_service:
-            self._meminfo_service.stop_monitoring()
+        # Stop meminfo monitoring (without creating the service just for this)
+        if "meminfo_service" in self.__dict__:
+            self.meminfo_service.stop_monitoring()
 
-        logger.debug("Application shutdown")
         Adw.Application.do_shutdown(self)
 
     def _on_quit(
@@ -161,12 +164,20 @@ class SwapApplication(Adw.Application):
         param: GLib.Variant | None,  # noqa: ARG002
     ) -> None:
         """Show about dialog."""
+        if not self._window:
+            return
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.present(self._window)
+
+    def _build_about_dialog(self) -> Adw.AboutDialog:
+        """Build the about dialog (done once, on first use)."""
         about = Adw.AboutDialog.new()
         about.set_application_name(APP_NAME)
         about.set_version(APP_VERSION)
         about.set_developer_name("BigLinux")
         about.set_license_type(Gtk.License.GPL_3_0)
-        about.set_comments(_("Configure swap settings for optimal performance"))
+        about.set_comments(_ABOUT_COMMENT)
         about.set_website("https://www.biglinux.com.br")
         about.set_issue_url(
             "https://github.com/biglinux/biglinux-systemd-swap-gui/issues"
@@ -180,9 +191,7 @@ class SwapApplication(Adw.Application):
         )
 
         about.set_copyright("© 2025-2026 BigLinux")
-
-        if self._window:
-            about.present(self._window)
+        return about
 
     def _on_apply_config(
         self,
@@ -218,5 +227,7 @@ class SwapApplication(Adw.Application):
     ) -> None:
         """Show welcome dialog."""
         if self._window:
+            from biglinux_swap.ui.welcome_dialog import WelcomeDialog
+
             welcome = WelcomeDialog(self._window)
             welcome.present()
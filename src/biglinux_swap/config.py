@@ -10,8 +10,10 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as _metadata_version
 from pathlib import Path
@@ -59,19 +61,28 @@ SPACING_LARGE = 24
 # Path Configuration
 # =============================================================================
 
-# System configuration paths
-CONFIG_FILE = Path("/etc/systemd/swap.conf")
+# System configuration paths (Path only where Path methods are used)
 CONFIG_PATH = "/etc/systemd/swap.conf"  # String version for subprocess
+CONFIG_FILE = Path(CONFIG_PATH)
 DEFAULT_CONFIG = Path("/usr/share/systemd-swap/swap-default.conf")
-MEMINFO_PATH = Path("/proc/meminfo")
-WORK_DIR = Path("/run/systemd/swap")
-
-# User config paths
-USER_CONFIG_DIR = Path.home() / ".config" / "biglinux-swap"
-USER_SETTINGS_FILE = USER_CONFIG_DIR / "settings.json"
+MEMINFO_PATH = "/proc/meminfo"
+WORK_DIR = "/run/systemd/swap"
 
 # Scripts path
-SCRIPTS_DIR = Path("/usr/share/biglinux-swap/scripts")
+SCRIPTS_DIR = "/usr/share/biglinux-swap/scripts"
+
+
+# User config paths (resolved on first use, not at import)
+@cache
+def user_config_dir() -> Path:
+    """Return the per-user configuration directory."""
+    return Path.home() / ".config" / "biglinux-swap"
+
+
+def user_settings_file() -> Path:
+    """Return the per-user settings file path."""
+    return user_config_dir() / "settings.json"
+
 
 # =============================================================================
 # Memory Chart Configuration
@@ -85,92 +96,99 @@ CHART_UPDATE_INTERVAL_MS = 1000  # 1 second
 # =============================================================================
 
 
-class SwapMode(Enum):
-    """Available swap modes."""
+class LabeledEnum(str, Enum):
+    """String enum whose members carry a translated label and description."""
 
-    AUTO = "auto"
-    ZSWAP_SWAPFILE = "zswap+swapfile"
-    ZRAM_SWAPFILE = "zram+swapfile"
-    ZRAM_ONLY = "zram"
-    DISABLED = "disabled"
+    label: str
+    description: str
 
+    def __new__(cls, value: str, label: str = "", description: str = "") -> LabeledEnum:
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        obj.description = description
+        return obj
 
-SWAP_MODE_NAMES: dict[SwapMode, str] = {
-    SwapMode.AUTO: _("Auto (Recommended)"),
-    SwapMode.ZSWAP_SWAPFILE: _("Zswap + SwapFile"),
-    SwapMode.ZRAM_SWAPFILE: _("Zram + SwapFile"),
-    SwapMode.ZRAM_ONLY: _("Zram Only"),
-    SwapMode.DISABLED: _("Disabled"),
-}
+    def __str__(self) -> str:
+        return self.value
 
-SWAP_MODE_DESCRIPTIONS: dict[SwapMode, str] = {
-    SwapMode.AUTO: _("Automatically detects the best mode for your system"),
-    SwapMode.ZSWAP_SWAPFILE: _(
-        "Compressed RAM cache + dynamic swap files (best for desktop)"
-    ),
-    SwapMode.ZRAM_SWAPFILE: _("Compressed RAM block device + swap files"),
-    SwapMode.ZRAM_ONLY: _(
-        "Only Zram, no disk swap (for systems without disk swap support)"
-    ),
-    SwapMode.DISABLED: _("Disable swap management (stops the service)"),
-}
 
+class SwapMode(LabeledEnum):
+    """Available swap modes."""
 
-class Compressor(Enum):
+    AUTO = (
+        "auto",
+        _("Auto (Recommended)"),
+        _("Automatically detects the best mode for your system"),
+    )
+    ZSWAP_SWAPFILE = (
+        "zswap+swapfile",
+        _("Zswap + SwapFile"),
+        _("Compressed RAM cache + dynamic swap files (best for desktop)"),
+    )
+    ZRAM_SWAPFILE = (
+        "zram+swapfile",
+        _("Zram + SwapFile"),
+        _("Compressed RAM block device + swap files"),
+    )
+    ZRAM_ONLY = (
+        "zram",
+        _("Zram Only"),
+        _("Only Zram, no disk swap (for systems without disk swap support)"),
+    )
+    DISABLED = (
+        "disabled",
+        _("Disabled"),
+        _("Disable swap management (stops the service)"),
+    )
+
+
+SWAP_MODE_LABELS: tuple[str, ...] = tuple(m.label for m in SwapMode)
+SWAP_MODE_BY_VALUE: dict[str, SwapMode] = {m.value: m for m in SwapMode}
+
+
+class Compressor(LabeledEnum):
     """Available compression algorithms."""
 
-    LZ4 = "lz4"
-    ZSTD = "zstd"
-    LZO = "lzo"
+    LZ4 = "lz4", _("LZ4 (Fastest)")
+    ZSTD = "zstd", _("Zstd (Balanced)")
+    LZO = "lzo", _("LZO (Legacy)")
 
 
-COMPRESSOR_NAMES: dict[Compressor, str] = {
-    Compressor.LZ4: _("LZ4 (Fastest)"),
-    Compressor.ZSTD: _("Zstd (Balanced)"),
-    Compressor.LZO: _("LZO (Legacy)"),
-}
+COMPRESSOR_LABELS: tuple[str, ...] = tuple(c.label for c in Compressor)
+COMPRESSOR_BY_VALUE: dict[str, Compressor] = {c.value: c for c in Compressor}
 
 
-class RecompressAlgorithm(Enum):
+class RecompressAlgorithm(LabeledEnum):
     """Available recompression algorithms (secondary compression for idle/huge pages)."""
 
-    ZSTD = "zstd"
-    DEFLATE = "deflate"
-    LZ4HC = "lz4hc"
+    ZSTD = "zstd", _("Zstd (Best ratio)")
+    DEFLATE = "deflate", _("Deflate (Balanced)")
+    LZ4HC = "lz4hc", _("LZ4HC (Faster)")
 
 
-RECOMPRESS_ALG_NAMES: dict[RecompressAlgorithm, str] = {
-    RecompressAlgorithm.ZSTD: _("Zstd (Best ratio)"),
-    RecompressAlgorithm.DEFLATE: _("Deflate (Balanced)"),
-    RecompressAlgorithm.LZ4HC: _("LZ4HC (Faster)"),
+RECOMPRESS_ALG_LABELS: tuple[str, ...] = tuple(a.label for a in RecompressAlgorithm)
+RECOMPRESS_ALG_BY_VALUE: dict[str, RecompressAlgorithm] = {
+    a.value: a for a in RecompressAlgorithm
 }
 
 
-class MglruTtl(Enum):
+class MglruTtl(LabeledEnum):
     """MGLRU min_ttl_ms presets."""
 
-    AUTO = "auto"
-    DISABLED = "0"
-    MS_100 = "100"
-    MS_300 = "300"
-    MS_600 = "600"
-    VERY_HIGH_RAM = "1000"  # 1s for 16GB+
-    HIGH_RAM = "3000"  # 3s for 4-8GB
-    MEDIUM_RAM = "5000"  # 5s for 2-4GB
-    LOW_RAM = "10000"  # 10s for 1-2GB
-
-
-MGLRU_TTL_NAMES: dict[MglruTtl, str] = {
-    MglruTtl.AUTO: _("Auto (Based on RAM)"),
-    MglruTtl.DISABLED: _("Disabled"),
-    MglruTtl.MS_100: _("100ms"),
-    MglruTtl.MS_300: _("300ms"),
-    MglruTtl.MS_600: _("600ms"),
-    MglruTtl.VERY_HIGH_RAM: _("1s (16GB+)"),
-    MglruTtl.HIGH_RAM: _("3s (4-8GB)"),
-    MglruTtl.MEDIUM_RAM: _("5s (2-4GB)"),
-    MglruTtl.LOW_RAM: _("10s (1-2GB)"),
-}
+    AUTO = "auto", _("Auto (Based on RAM)")
+    DISABLED = "0", _("Disabled")
+    MS_100 = "100", _("100ms")
+    MS_300 = "300", _("300ms")
+    MS_600 = "600", _("600ms")
+    VERY_HIGH_RAM = "1000", _("1s (16GB+)")
+    HIGH_RAM = "3000", _("3s (4-8GB)")
+    MEDIUM_RAM = "5000", _("5s (2-4GB)")
+    LOW_RAM = "10000", _("10s (1-2GB)")
+
+
+MGLRU_TTL_LABELS: tuple[str, ...] = tuple(m.label for m in MglruTtl)
+MGLRU_TTL_BY_VALUE: dict[str, MglruTtl] = {m.value: m for m in MglruTtl}
 
 
 # =============================================================================
@@ -262,38 +280,28 @@ MAX_CHUNK_SIZE_DEFAULT = "64G"
 # =============================================================================
 
 
-class StorageType(Enum):
-    """Storage device types for priority calculation."""
-
-    NVME = "nvme"
-    SSD = "ssd"
-    HDD = "hdd"
-    EMMC = "emmc"
-    SD = "sd"
-    UNKNOWN = "unknown"
+class StorageType(LabeledEnum):
+    """Storage device types, with swap priority (PLANNING.md 12.6.3)."""
 
+    priority: int
 
-STORAGE_TYPE_NAMES: dict[StorageType, str] = {
-    StorageType.NVME: _("NVMe SSD"),
-    StorageType.SSD: _("SATA SSD"),
-    StorageType.HDD: _("Hard Drive"),
-    StorageType.EMMC: _("eMMC"),
-    StorageType.SD: _("SD Card"),
-    StorageType.UNKNOWN: _("Unknown"),
-}
+    def __new__(cls, value: str, label: str, priority: int) -> StorageType:
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.label = label
+        obj.description = ""
+        obj.priority = priority
+        return obj
 
-# Swap priorities by storage type (PLANNING.md 12.6.3)
-STORAGE_SWAP_PRIORITY: dict[StorageType, int] = {
-    StorageType.NVME: 100,
-    StorageType.SSD: 75,
-    StorageType.EMMC: 50,
-    StorageType.SD: 25,
-    StorageType.HDD: 10,
-    StorageType.UNKNOWN: 0,
-}
+    NVME = "nvme", _("NVMe SSD"), 100
+    SSD = "ssd", _("SATA SSD"), 75
+    HDD = "hdd", _("Hard Drive"), 10
+    EMMC = "emmc", _("eMMC"), 50
+    SD = "sd", _("SD Card"), 25
+    UNKNOWN = "unknown", _("Unknown"), 0
 
 
-class VirtualizationType(Enum):
+class VirtualizationType(LabeledEnum):
     """Virtualization environment types (PLANNING.md 12.5)."""
 
     NONE = "none"  # Bare metal
@@ -308,23 +316,17 @@ class VirtualizationType(Enum):
     OTHER = "other"
 
 
-class DiscardPolicy(Enum):
+class DiscardPolicy(LabeledEnum):
     """Discard/TRIM policies for SSDs (PLANNING.md 12.6.2)."""
 
-    NONE = "none"  # No TRIM
-    ONCE = "once"  # TRIM at swapoff only
-    PAGES = "pages"  # Continuous TRIM
-    BOTH = "both"  # once + pages
-    AUTO = "auto"  # Auto-detect based on storage
+    NONE = "none", _("Disabled")  # No TRIM
+    ONCE = "once", _("At deactivation (recommended)")  # TRIM at swapoff only
+    PAGES = "pages", _("Continuous (may impact performance)")  # Continuous TRIM
+    BOTH = "both", _("Both modes")  # once + pages
+    AUTO = "auto", _("Auto-detect")  # Auto-detect based on storage
 
 
-DISCARD_POLICY_NAMES: dict[DiscardPolicy, str] = {
-    DiscardPolicy.NONE: _("Disabled"),
-    DiscardPolicy.ONCE: _("At deactivation (recommended)"),
-    DiscardPolicy.PAGES: _("Continuous (may impact performance)"),
-    DiscardPolicy.BOTH: _("Both modes"),
-    DiscardPolicy.AUTO: _("Auto-detect"),
-}
+DISCARD_POLICY_BY_VALUE: dict[str, DiscardPolicy] = {p.value: p for p in DiscardPolicy}
 
 
 # =============================================================================
@@ -332,7 +334,7 @@ DISCARD_POLICY_NAMES: dict[DiscardPolicy, str] = {
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ZswapConfig:
     """Zswap configuration."""
 
@@ -342,8 +344,41 @@ class ZswapConfig:
     shrinker_enabled: bool = True
     accept_threshold: int = ZSWAP_ACCEPT_THRESHOLD_DEFAULT
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to dictionary for JSON serialization."""
+        return {
+            "compressor": self.compressor.value,
+            "max_pool_percent": self.max_pool_percent,
+            "zpool": self.zpool,
+            "shrinker_enabled": self.shrinker_enabled,
+            "accept_threshold": self.accept_threshold,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZswapConfig:
+        """Create config from dictionary, clamping values to valid ranges."""
+        _get = data.get
+        return cls(
+            compressor=COMPRESSOR_BY_VALUE.get(_get("compressor"), Compressor.ZSTD),
+            max_pool_percent=max(
+                ZSWAP_MAX_POOL_MIN,
+                min(
+                    ZSWAP_MAX_POOL_MAX, _get("max_pool_percent", ZSWAP_MAX_POOL_DEFAULT)
+                ),
+            ),
+            zpool=_get("zpool", "zsmalloc"),
+            shrinker_enabled=_get("shrinker_enabled", True),
+            accept_threshold=max(
+                ZSWAP_ACCEPT_THRESHOLD_MIN,
+                min(
+                    ZSWAP_ACCEPT_THRESHOLD_MAX,
+                    _get("accept_threshold", ZSWAP_ACCEPT_THRESHOLD_DEFAULT),
+                ),
+            ),
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ZramConfig:
     """Zram configuration."""
 
@@ -358,8 +393,54 @@ class ZramConfig:
     recompress_enabled: bool = True
     recompress_algorithm: RecompressAlgorithm = RecompressAlgorithm.ZSTD
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to dictionary for JSON serialization."""
+        return {
+            "size_percent": self.size_percent,
+            "alg": self.alg.value,
+            "mem_limit_percent": self.mem_limit_percent,
+            "priority": self.priority,
+            "writeback_enabled": self.writeback_enabled,
+            "writeback_size": self.writeback_size,
+            "writeback_max_size": self.writeback_max_size,
+            "writeback_threshold": self.writeback_threshold,
+            "recompress_enabled": self.recompress_enabled,
+            "recompress_algorithm": self.recompress_algorithm.value,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ZramConfig:
+        """Create config from dictionary, clamping values to valid ranges."""
+        _get = data.get
+        return cls(
+            size_percent=max(
+                ZRAM_SIZE_MIN,
+                min(ZRAM_SIZE_MAX, _get("size_percent", ZRAM_SIZE_DEFAULT)),
+            ),
+            alg=COMPRESSOR_BY_VALUE.get(_get("alg"), Compressor.LZ4),
+            mem_limit_percent=max(
+                ZRAM_MEM_LIMIT_MIN,
+                min(
+                    ZRAM_MEM_LIMIT_MAX,
+                    _get("mem_limit_percent", ZRAM_MEM_LIMIT_DEFAULT),
+                ),
+            ),
+            priority=max(
+                ZRAM_PRIORITY_MIN,
+                min(ZRAM_PRIORITY_MAX, _get("priority", ZRAM_PRIORITY_DEFAULT)),
+            ),
+            writeback_enabled=_get("writeback_enabled", False),
+            writeback_size=_get("writeback_size", "1G"),
+            writeback_max_size=_get("writeback_max_size", "8G"),
+            writeback_threshold=_get("writeback_threshold", 50),
+            recompress_enabled=_get("recompress_enabled", True),
+            recompress_algorithm=RECOMPRESS_ALG_BY_VALUE.get(
+                _get("recompress_algorithm"), RecompressAlgorithm.ZSTD
+            ),
+        )
+
+
+@dataclass(slots=True)
 class SwapFileConfig:
     """SwapFile configuration (renamed from SwapFC per PLANNING.md 12.1)."""
 
@@ -386,8 +467,86 @@ class SwapFileConfig:
     direct_io: bool = True
     priority: int = -1  # -1 = auto-calculate based on storage type
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert config to dictionary for JSON serialization."""
+        return {
+            "enabled": self.enabled,
+            "path": self.path,
+            "chunk_size": self.chunk_size,
+            "max_chunk_size": self.max_chunk_size,
+            "max_count": self.max_count,
+            "min_count": self.min_count,
+            "scaling_step": self.scaling_step,
+            "shrink_threshold": self.shrink_threshold,
+            "safe_headroom": self.safe_headroom,
+            "use_partitions": self.use_partitions,
+            "partition_priority": self.partition_priority,
+            "partition_threshold": self.partition_threshold,
+            "min_count_with_partitions": self.min_count_with_partitions,
+            "discard_policy": self.discard_policy.value,
+            "direct_io": self.direct_io,
+            "priority": self.priority,
+        }
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SwapFileConfig:
+        """Create config from dictionary, clamping values to valid ranges."""
+        _get = data.get
+        return cls(
+            enabled=_get("enabled", True),
+            path=_get("path", "/swapfile"),
+            chunk_size=_get("chunk_size", CHUNK_SIZE_DEFAULT),
+            max_chunk_size=_get("max_chunk_size", MAX_CHUNK_SIZE_DEFAULT),
+            max_count=max(
+                SWAPFILE_MAX_COUNT_MIN,
+                min(
+                    SWAPFILE_MAX_COUNT_MAX,
+                    _get("max_count", SWAPFILE_MAX_COUNT_DEFAULT),
+                ),
+            ),
+            min_count=_get("min_count", SWAPFILE_MIN_COUNT),
+            scaling_step=max(
+                SWAPFILE_SCALING_STEP_MIN,
+                min(
+                    SWAPFILE_SCALING_STEP_MAX,
+                    _get("scaling_step", SWAPFILE_SCALING_STEP_DEFAULT),
+                ),
+            ),
+            shrink_threshold=max(
+                SWAPFILE_SHRINK_THRESHOLD_MIN,
+                min(
+                    SWAPFILE_SHRINK_THRESHOLD_MAX,
+                    _get("shrink_threshold", SWAPFILE_SHRINK_THRESHOLD_DEFAULT),
+                ),
+            ),
+            safe_headroom=max(
+                SWAPFILE_SAFE_HEADROOM_MIN,
+                min(
+                    SWAPFILE_SAFE_HEADROOM_MAX,
+                    _get("safe_headroom", SWAPFILE_SAFE_HEADROOM_DEFAULT),
+                ),
+            ),
+            use_partitions=_get("use_partitions", True),
+            partition_priority=_get(
+                "partition_priority", SWAPFILE_PARTITION_PRIORITY_DEFAULT
+            ),
+            partition_threshold=max(
+                SWAPFILE_PARTITION_THRESHOLD_MIN,
+                min(
+                    SWAPFILE_PARTITION_THRESHOLD_MAX,
+                    _get("partition_threshold", SWAPFILE_PARTITION_THRESHOLD_DEFAULT),
+                ),
+            ),
+            min_count_with_partitions=_get("min_count_with_partitions", 0),
+            discard_policy=DISCARD_POLICY_BY_VALUE.get(
+                _get("discard_policy"), DiscardPolicy.AUTO
+            ),
+            direct_io=_get("direct_io", True),
+            priority=_get("priority", -1),
+        )
+
+
+@dataclass(slots=True)
 class SwapPartitionInfo:
     """Information about a swap partition (PLANNING.md 12.7)."""
 
@@ -399,15 +558,15 @@ class SwapPartitionInfo:
     is_active: bool = False
     priority: int = 0
 
-    @property
-    def usage_percent(self) -> float:
-        """Calculate usage percentage."""
-        if self.size_bytes == 0:
-            return 0.0
-        return (self.used_bytes / self.size_bytes) * 100.0
+    # Derived once per snapshot in __post_init__
+    usage_percent: float = field(init=False, compare=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        if self.size_bytes:
+            self.usage_percent = self.used_bytes * 100.0 / self.size_bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapFileInfo:
     """Information about an individual swap file (PLANNING.md 12.4)."""
 
@@ -417,20 +576,19 @@ class SwapFileInfo:
     is_active: bool = False
     priority: int = 0
 
-    @property
-    def usage_percent(self) -> float:
-        """Calculate usage percentage."""
-        if self.size_bytes == 0:
-            return 0.0
-        return (self.used_bytes / self.size_bytes) * 100.0
+    # Derived once per snapshot in __post_init__
+    usage_percent: float = field(init=False, compare=False, default=0.0)
+    is_removal_candidate: bool = field(init=False, compare=False, default=True)
 
-    @property
-    def is_removal_candidate(self) -> bool:
-        """Check if this file is a candidate for removal."""
-        return self.usage_percent < SWAPFILE_SHRINK_THRESHOLD_DEFAULT
+    def __post_init__(self) -> None:
+        if self.size_bytes:
+            self.usage_percent = self.used_bytes * 100.0 / self.size_bytes
+        self.is_removal_candidate = (
+            self.usage_percent < SWAPFILE_SHRINK_THRESHOLD_DEFAULT
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapConfig:
     """Complete swap configuration."""
 
@@ -442,157 +600,82 @@ class SwapConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert config to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Convert enums to their values
-        data["mode"] = self.mode.value
-        data["mglru_min_ttl"] = self.mglru_min_ttl.value
-        data["zswap"]["compressor"] = self.zswap.compressor.value
-        data["zram"]["alg"] = self.zram.alg.value
-        data["zram"]["recompress_algorithm"] = self.zram.recompress_algorithm.value
-        data["swapfile"]["discard_policy"] = self.swapfile.discard_policy.value
-        return data
+        return {
+            "mode": self.mode.value,
+            "zswap": self.zswap.to_dict(),
+            "zram": self.zram.to_dict(),
+            "swapfile": self.swapfile.to_dict(),
+            "mglru_min_ttl": self.mglru_min_ttl.value,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> SwapConfig:
         """Create config from dictionary."""
-        config = cls()
-
-        if "mode" in data:
-            config.mode = SwapMode(data["mode"])
-
-        if "mglru_min_ttl" in data:
-            config.mglru_min_ttl = MglruTtl(data["mglru_min_ttl"])
-
-        if "zswap" in data:
-            zs = data["zswap"]
-            max_pool = zs.get("max_pool_percent", ZSWAP_MAX_POOL_DEFAULT)
-            max_pool = max(ZSWAP_MAX_POOL_MIN, min(ZSWAP_MAX_POOL_MAX, max_pool))
-            accept_thresh = zs.get("accept_threshold", ZSWAP_ACCEPT_THRESHOLD_DEFAULT)
-            accept_thresh = max(
-                ZSWAP_ACCEPT_THRESHOLD_MIN,
-                min(ZSWAP_ACCEPT_THRESHOLD_MAX, accept_thresh),
-            )
-            config.zswap = ZswapConfig(
-                compressor=Compressor(zs.get("compressor", "zstd")),
-                max_pool_percent=max_pool,
-                zpool=zs.get("zpool", "zsmalloc"),
-                shrinker_enabled=zs.get("shrinker_enabled", True),
-                accept_threshold=accept_thresh,
-            )
-
-        if "zram" in data:
-            zr = data["zram"]
-            size_pct = zr.get("size_percent", ZRAM_SIZE_DEFAULT)
-            size_pct = max(ZRAM_SIZE_MIN, min(ZRAM_SIZE_MAX, size_pct))
-            mem_limit = zr.get("mem_limit_percent", ZRAM_MEM_LIMIT_DEFAULT)
-            mem_limit = max(ZRAM_MEM_LIMIT_MIN, min(ZRAM_MEM_LIMIT_MAX, mem_limit))
-            priority = zr.get("priority", ZRAM_PRIORITY_DEFAULT)
-            priority = max(ZRAM_PRIORITY_MIN, min(ZRAM_PRIORITY_MAX, priority))
-            config.zram = ZramConfig(
-                size_percent=size_pct,
-                alg=Compressor(zr.get("alg", "lz4")),
-                mem_limit_percent=mem_limit,
-                priority=priority,
-                writeback_enabled=zr.get("writeback_enabled", False),
-                writeback_size=zr.get("writeback_size", "1G"),
-                writeback_max_size=zr.get("writeback_max_size", "8G"),
-                writeback_threshold=zr.get("writeback_threshold", 50),
-                recompress_enabled=zr.get("recompress_enabled", True),
-                recompress_algorithm=RecompressAlgorithm(
-                    zr.get("recompress_algorithm", "zstd")
-                ),
-            )
-
-        sf = data.get("swapfile", {})
-        if sf:
-            discard_str = sf.get("discard_policy", "auto")
-            try:
-                discard_policy = DiscardPolicy(discard_str)
-            except ValueError:
-                discard_policy = DiscardPolicy.AUTO
-
-            max_count = sf.get("max_count", SWAPFILE_MAX_COUNT_DEFAULT)
-            max_count = max(
-                SWAPFILE_MAX_COUNT_MIN, min(SWAPFILE_MAX_COUNT_MAX, max_count)
-            )
-            scaling_step = sf.get("scaling_step", SWAPFILE_SCALING_STEP_DEFAULT)
-            scaling_step = max(
-                SWAPFILE_SCALING_STEP_MIN, min(SWAPFILE_SCALING_STEP_MAX, scaling_step)
-            )
-            shrink_thresh = sf.get(
-                "shrink_threshold", SWAPFILE_SHRINK_THRESHOLD_DEFAULT
-            )
-            shrink_thresh = max(
-                SWAPFILE_SHRINK_THRESHOLD_MIN,
-                min(SWAPFILE_SHRINK_THRESHOLD_MAX, shrink_thresh),
-            )
-            safe_head = sf.get("safe_headroom", SWAPFILE_SAFE_HEADROOM_DEFAULT)
-            safe_head = max(
-                SWAPFILE_SAFE_HEADROOM_MIN, min(SWAPFILE_SAFE_HEADROOM_MAX, safe_head)
-            )
-            part_thresh = sf.get(
-                "partition_threshold", SWAPFILE_PARTITION_THRESHOLD_DEFAULT
-            )
-            part_thresh = max(
-                SWAPFILE_PARTITION_THRESHOLD_MIN,
-                min(SWAPFILE_PARTITION_THRESHOLD_MAX, part_thresh),
-            )
-
-            config.swapfile = SwapFileConfig(
-                enabled=sf.get("enabled", True),
-                path=sf.get("path", "/swapfile"),
-                chunk_size=sf.get("chunk_size", CHUNK_SIZE_DEFAULT),
-                max_chunk_size=sf.get("max_chunk_size", MAX_CHUNK_SIZE_DEFAULT),
-                max_count=max_count,
-                min_count=sf.get("min_count", SWAPFILE_MIN_COUNT),
-                scaling_step=scaling_step,
-                shrink_threshold=shrink_thresh,
-                safe_headroom=safe_head,
-                use_partitions=sf.get("use_partitions", True),
-                partition_priority=sf.get(
-                    "partition_priority", SWAPFILE_PARTITION_PRIORITY_DEFAULT
-                ),
-                partition_threshold=part_thresh,
-                min_count_with_partitions=sf.get("min_count_with_partitions", 0),
-                discard_policy=discard_policy,
-                direct_io=sf.get("direct_io", True),
-                priority=sf.get("priority", -1),
-            )
-
-        return config
-
-
-@dataclass
+        _get = data.get
+        zswap = _get("zswap")
+        zram = _get("zram")
+        swapfile = _get("swapfile")
+        return cls(
+            mode=SWAP_MODE_BY_VALUE.get(_get("mode"), SwapMode.AUTO),
+            zswap=ZswapConfig.from_dict(zswap) if zswap is not None else ZswapConfig(),
+            zram=ZramConfig.from_dict(zram) if zram is not None else ZramConfig(),
+            swapfile=SwapFileConfig.from_dict(swapfile)
+            if swapfile
+            else SwapFileConfig(),
+            mglru_min_ttl=MGLRU_TTL_BY_VALUE.get(_get("mglru_min_ttl"), MglruTtl.AUTO),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class WindowConfig:
-    """Window state configuration."""
+    """Window state configuration (immutable; use dataclasses.replace)."""
 
     width: int = WINDOW_WIDTH_DEFAULT
     height: int = WINDOW_HEIGHT_DEFAULT
     maximized: bool = False
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert window state to dictionary."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "maximized": self.maximized,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> WindowConfig:
+        """Create window state from dictionary."""
+        _get = data.get
+        return cls(
+            width=_get("width", WINDOW_WIDTH_DEFAULT),
+            height=_get("height", WINDOW_HEIGHT_DEFAULT),
+            maximized=_get("maximized", False),
+        )
+
+
+# Shared default: frozen, so every AppSettings() can reuse one instance
+_DEFAULT_WINDOW = WindowConfig()
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """Application settings (user preferences, not swap config)."""
 
-    window: WindowConfig = field(default_factory=WindowConfig)
+    window: WindowConfig = _DEFAULT_WINDOW
 
     def to_dict(self) -> dict[str, Any]:
         """Convert settings to dictionary."""
-        return asdict(self)
+        return {"window": self.window.to_dict()}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AppSettings:
         """Create settings from dictionary."""
-        settings = cls()
-        if "window" in data:
-            w = data["window"]
-            settings.window = WindowConfig(
-                width=w.get("width", WINDOW_WIDTH_DEFAULT),
-                height=w.get("height", WINDOW_HEIGHT_DEFAULT),
-                maximized=w.get("maximized", False),
-            )
-        return settings
+        window = data.get("window")
+        return cls(
+            window=WindowConfig.from_dict(window)
+            if window is not None
+            else _DEFAULT_WINDOW
+        )
 
 
 # =============================================================================
@@ -602,14 +685,12 @@ class AppSettings:
 
 def load_app_settings() -> AppSettings:
     """Load application settings from user config file."""
-    if not USER_SETTINGS_FILE.exists():
+    try:
+        with open(user_settings_file(), "rb") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
         logger.info("No settings file found, using defaults")
         return AppSettings()
-
-    try:
-        with open(USER_SETTINGS_FILE, encoding="utf-8") as f:
-            data = json.load(f)
-            return AppSettings.from_dict(data)
     except json.JSONDecodeError as e:
         logger.error("Error parsing settings file: %s", e)
         return AppSettings()
@@ -617,14 +698,25 @@ def load_app_settings() -> AppSettings:
         logger.error("Error reading settings file: %s", e)
         return AppSettings()
 
+    if not isinstance(data, dict):
+        logger.error("Settings file does not contain a JSON object")
+        return AppSettings()
+    return AppSettings.from_dict(data)
+
 
 def save_app_settings(settings: AppSettings) -> bool:
     """Save application settings to user config file."""
     try:
-        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        data = settings.to_dict()
-        with open(USER_SETTINGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
+        config_dir = user_config_dir()
+        config_dir.mkdir(parents=True, exist_ok=True)
+        settings_file = config_dir / "settings.json"
+        tmp_file = settings_file.with_suffix(".tmp")
+        # Single write + fsync + rename so a crash never leaves a torn file
+        with open(tmp_file, "wb") as f:
+            f.write(json.dumps(settings.to_dict(), indent=4).encode())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, settings_file)
         logger.debug("Settings saved successfully")
         return True
     except OSError as e:
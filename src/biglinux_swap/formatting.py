@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Text formatting helpers for BigLinux Swap Manager.
+
+Pure functions with no GTK dependency, shared by the UI and services.
+"""
+
+from __future__ import annotations
+
+__all__ = ["format_bytes"]
+
+_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+_SHIFTS = (0, 10, 20, 30, 40)
+
+
+def format_bytes(size_bytes: int) -> str:
+    """Format a byte count with a binary unit (unit picked via bit_length)."""
+    idx = min((size_bytes.bit_length() - 1) // 10, 4) if size_bytes > 0 else 0
+    if idx == 0:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << _SHIFTS[idx]):.1f} {_UNITS[idx]}"
@@ -13,22 +13,34 @@ import sys
 from typing import NoReturn
 
 
+# Accepted BIGLINUX_SWAP_LOG_LEVEL values
+_LEVELS: dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
 def setup_logging() -> None:
     """Configure logging based on environment."""
     log_level = os.environ.get("BIGLINUX_SWAP_LOG_LEVEL", "WARNING").upper()
-
-    # Map level name to logging constant
-    level = getattr(logging, log_level, logging.WARNING)
-
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%H:%M:%S",
-    )
-
-    # Suppress GTK warnings in production
+    level = _LEVELS.get(log_level, logging.WARNING)
+
+    # Leave an already configured root logger (e.g. a test harness) alone
+    if not logging.root.handlers:
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%H:%M:%S",
+        )
+
+    # Suppress GTK warnings in production, and let every logger.debug()
+    # bail out on the manager-wide disable check before any record work
     if level > logging.DEBUG:
         logging.getLogger("gi").setLevel(logging.ERROR)
+        logging.disable(logging.DEBUG)
 
 
 def main() -> NoReturn:
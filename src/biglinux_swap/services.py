@@ -8,9 +8,9 @@ swap management, storage detection, and service control.
 
 from __future__ import annotations
 
-import contextlib
 import glob
 import logging
+import os
 import re
 import subprocess
 from collections.abc import Callable
@@ -19,23 +19,18 @@ from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import gi
-
-gi.require_version("GLib", "2.0")
-from gi.repository import GLib
-
 if TYPE_CHECKING:
     from biglinux_swap.config import SwapConfig
 
 from biglinux_swap.config import (
     CHART_UPDATE_INTERVAL_MS,
+    COMPRESSOR_BY_VALUE,
     CONFIG_FILE,
     DEFAULT_CONFIG,
     MEMINFO_PATH,
-    STORAGE_SWAP_PRIORITY,
-    Compressor,
-    MglruTtl,
-    RecompressAlgorithm,
+    MGLRU_TTL_BY_VALUE,
+    RECOMPRESS_ALG_BY_VALUE,
+    SWAP_MODE_BY_VALUE,
     StorageType,
     SwapConfig,
     SwapFileInfo,
@@ -43,12 +38,16 @@ from biglinux_swap.config import (
     SwapPartitionInfo,
     VirtualizationType,
 )
+from biglinux_swap.formatting import format_bytes
 
 logger = logging.getLogger(__name__)
 
 # MGLRU sysfs path
 MGLRU_ENABLED_PATH = Path("/sys/kernel/mm/lru_gen/enabled")
 
+# zswap module parameters (one value per file)
+_ZSWAP_PARAMS = "/sys/module/zswap/parameters/"
+
 
 def is_mglru_supported() -> bool:
     """Check if MGLRU is supported by the current kernel."""
@@ -206,12 +205,14 @@ class ConfigService:
     def _apply_values(self, config: SwapConfig, values: dict[str, str]) -> SwapConfig:
         """Apply parsed values to a SwapConfig object."""
         if "swap_mode" in values:
-            with contextlib.suppress(ValueError):
-                config.mode = SwapMode(values["swap_mode"].lower())
+            config.mode = SWAP_MODE_BY_VALUE.get(
+                values["swap_mode"].lower(), config.mode
+            )
 
         if "zswap_compressor" in values:
-            with contextlib.suppress(ValueError):
-                config.zswap.compressor = Compressor(values["zswap_compressor"])
+            config.zswap.compressor = COMPRESSOR_BY_VALUE.get(
+                values["zswap_compressor"], config.zswap.compressor
+            )
 
         if "zswap_max_pool_percent" in values:
             config.zswap.max_pool_percent = self._parse_int(
@@ -237,8 +238,9 @@ class ConfigService:
             )
 
         if "zram_alg" in values:
-            with contextlib.suppress(ValueError):
-                config.zram.alg = Compressor(values["zram_alg"])
+            config.zram.alg = COMPRESSOR_BY_VALUE.get(
+                values["zram_alg"], config.zram.alg
+            )
 
         if "zram_mem_limit" in values:
             config.zram.mem_limit_percent = self._parse_percent(
@@ -254,10 +256,9 @@ class ConfigService:
             config.zram.writeback_enabled = self._parse_bool(values["zram_writeback"])
 
         if "zram_recomp_alg" in values:
-            with contextlib.suppress(ValueError):
-                config.zram.recompress_algorithm = RecompressAlgorithm(
-                    values["zram_recomp_alg"]
-                )
+            config.zram.recompress_algorithm = RECOMPRESS_ALG_BY_VALUE.get(
+                values["zram_recomp_alg"], config.zram.recompress_algorithm
+            )
 
         if "zram_recompress_disabled" in values:
             config.zram.recompress_enabled = not self._parse_bool(
@@ -279,8 +280,9 @@ class ConfigService:
             )
 
         if "mglru_min_ttl_ms" in values:
-            with contextlib.suppress(ValueError):
-                config.mglru_min_ttl = MglruTtl(values["mglru_min_ttl_ms"])
+            config.mglru_min_ttl = MGLRU_TTL_BY_VALUE.get(
+                values["mglru_min_ttl_ms"], config.mglru_min_ttl
+            )
 
         return config
 
@@ -378,15 +380,7 @@ class MemoryStats:
         return (self.swap_used / self.swap_total) * 100.0
 
     def format_size(self, size_bytes: int) -> str:
-        units = ["B", "KiB", "MiB", "GiB", "TiB"]
-        unit_index = 0
-        size = float(size_bytes)
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
-        if unit_index == 0:
-            return f"{int(size)} {units[unit_index]}"
-        return f"{size:.1f} {units[unit_index]}"
+        return format_bytes(size_bytes)
 
     @property
     def mem_total_formatted(self) -> str:
@@ -425,6 +419,49 @@ class MemoryStats:
         return (self.swap_disk_used / self.swap_total) * 100.0
 
 
+# /proc/meminfo keys used by MemoryStats (values are reported in kB)
+_MEMINFO_FIELDS: dict[bytes, str] = {
+    b"MemTotal:": "mem_total",
+    b"MemFree:": "mem_free",
+    b"MemAvailable:": "mem_available",
+    b"Buffers:": "mem_buffers",
+    b"Cached:": "mem_cached",
+    b"SwapTotal:": "swap_total",
+    b"SwapFree:": "swap_free",
+    b"Zswap:": "zswap_pool",
+    b"Zswapped:": "zswap_stored",
+}
+
+
+def _read_sysfs(path: str) -> bytes:
+    """Read a single-value sysfs/procfs file with one small read() call."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 64).strip()
+    finally:
+        os.close(fd)
+
+
+def _read_meminfo(stats: MemoryStats) -> None:
+    """Fill stats from a single read() of /proc/meminfo (no torn reads)."""
+    fd = os.open(MEMINFO_PATH, os.O_RDONLY)
+    try:
+        data = os.read(fd, 8192)
+    finally:
+        os.close(fd)
+
+    remaining = len(_MEMINFO_FIELDS)
+    for line in data.splitlines():
+        key, _sep, rest = line.partition(b" ")
+        attr = _MEMINFO_FIELDS.get(key)
+        if attr is None:
+            continue
+        setattr(stats, attr, int(rest.split()[0]) * 1024)
+        remaining -= 1
+        if not remaining:
+            break
+
+
 class MeminfoService:
     """Service for monitoring memory usage from /proc/meminfo."""
 
@@ -437,33 +474,8 @@ class MeminfoService:
         stats = MemoryStats()
 
         try:
-            with open(MEMINFO_PATH, encoding="utf-8") as f:
-                for line in f:
-                    parts = line.split()
-                    if len(parts) < 2:
-                        continue
-                    key = parts[0].rstrip(":")
-                    value_bytes = int(parts[1]) * 1024
-
-                    if key == "MemTotal":
-                        stats.mem_total = value_bytes
-                    elif key == "MemFree":
-                        stats.mem_free = value_bytes
-                    elif key == "MemAvailable":
-                        stats.mem_available = value_bytes
-                    elif key == "Buffers":
-                        stats.mem_buffers = value_bytes
-                    elif key == "Cached":
-                        stats.mem_cached = value_bytes
-                    elif key == "SwapTotal":
-                        stats.swap_total = value_bytes
-                    elif key == "SwapFree":
-                        stats.swap_free = value_bytes
-                    elif key == "Zswap":
-                        stats.zswap_pool = value_bytes
-                    elif key == "Zswapped":
-                        stats.zswap_stored = value_bytes
-        except (OSError, ValueError) as e:
+            _read_meminfo(stats)
+        except (OSError, ValueError, IndexError) as e:
             logger.error("Error reading meminfo: %s", e)
 
         self._read_swap_devices(stats)
@@ -501,6 +513,9 @@ class MeminfoService:
         interval_ms: int = CHART_UPDATE_INTERVAL_MS,
     ) -> None:
         """Start periodic monitoring."""
+        # GLib is only needed once monitoring starts; keeps this module gi-free
+        from biglinux_swap._gi_bootstrap import GLib
+
         self.stop_monitoring()
         self._callback = callback
 
@@ -510,12 +525,18 @@ class MeminfoService:
                 self._callback(stats)
             return True
 
-        self._timer_id = GLib.timeout_add(interval_ms, _update)
+        # Whole-second intervals use the coalescing seconds timer
+        if interval_ms % 1000 == 0:
+            self._timer_id = GLib.timeout_add_seconds(interval_ms // 1000, _update)
+        else:
+            self._timer_id = GLib.timeout_add(interval_ms, _update)
         _update()
 
     def stop_monitoring(self) -> None:
         """Stop periodic monitoring."""
         if self._timer_id:
+            from biglinux_swap._gi_bootstrap import GLib
+
             GLib.source_remove(self._timer_id)
             self._timer_id = 0
         self._callback = None
@@ -636,43 +657,27 @@ class SwapService:
         self, status: SwapStatus, mem_stats: MemoryStats | None = None
     ) -> None:
         """Read zswap parameters from sysfs. Pool/stored bytes from mem_stats if available."""
-        try:
-            # Check if zswap is enabled via sysfs
-            zswap_enabled_path = Path("/sys/module/zswap/parameters/enabled")
-            if zswap_enabled_path.exists():
-                enabled_val = zswap_enabled_path.read_text().strip()
-                status.zswap.enabled = enabled_val in ("Y", "1")
-
-            # Use pre-read meminfo values if available, else read /proc/meminfo
-            if mem_stats is not None:
-                status.zswap.pool_size_bytes = mem_stats.zswap_pool
-                status.zswap.stored_data_bytes = mem_stats.zswap_stored
-            else:
-                with open(MEMINFO_PATH, encoding="utf-8") as f:
-                    for line in f:
-                        parts = line.split()
-                        if len(parts) < 2:
-                            continue
-                        key = parts[0].rstrip(":")
-                        value_bytes = int(parts[1]) * 1024
-                        if key == "Zswap":
-                            status.zswap.pool_size_bytes = value_bytes
-                        elif key == "Zswapped":
-                            status.zswap.stored_data_bytes = value_bytes
-
-            # Read additional parameters from sysfs
-            params_path = Path("/sys/module/zswap/parameters")
-            if params_path.is_dir():
-                compressor_file = params_path / "compressor"
-                if compressor_file.exists():
-                    status.zswap.compressor = compressor_file.read_text().strip()
-
-                max_pool_file = params_path / "max_pool_percent"
-                if max_pool_file.exists():
-                    status.zswap.max_pool_percent = int(
-                        max_pool_file.read_text().strip()
-                    )
+        # Pool/stored sizes: reuse pre-read meminfo values if available
+        if mem_stats is None:
+            mem_stats = MemoryStats()
+            try:
+                _read_meminfo(mem_stats)
+            except (OSError, ValueError, IndexError) as e:
+                logger.debug("Error reading meminfo: %s", e)
+        status.zswap.pool_size_bytes = mem_stats.zswap_pool
+        status.zswap.stored_data_bytes = mem_stats.zswap_stored
 
+        try:
+            status.zswap.enabled = _read_sysfs(_ZSWAP_PARAMS + "enabled") in (
+                b"Y",
+                b"1",
+            )
+            status.zswap.compressor = _read_sysfs(_ZSWAP_PARAMS + "compressor").decode()
+            status.zswap.max_pool_percent = int(
+                _read_sysfs(_ZSWAP_PARAMS + "max_pool_percent")
+            )
+        except FileNotFoundError:
+            pass  # zswap not built into this kernel
         except (OSError, ValueError) as e:
             logger.debug("Error reading zswap stats: %s", e)
 
@@ -682,8 +687,7 @@ class SwapService:
         try:
             total_zram_size = 0
             for disksize_path in glob.glob("/sys/block/zram*/disksize"):
-                with open(disksize_path, encoding="utf-8") as f:
-                    total_zram_size += int(f.read().strip())
+                total_zram_size += int(_read_sysfs(disksize_path))
             if total_zram_size > 0:
                 status.zram.enabled = True
                 status.zram.total_size_bytes = total_zram_size
@@ -853,7 +857,7 @@ class SwapService:
 
     def get_swap_priority(self, storage_type: StorageType) -> int:
         """Get recommended swap priority for storage type."""
-        return STORAGE_SWAP_PRIORITY.get(storage_type, 0)
+        return storage_type.priority
 
     def get_swapfiles_info(self) -> list[SwapFileInfo]:
         """Get detailed info for each active swap file."""
@@ -1,9 +1,30 @@
 """UI modules for BigLinux Swap Manager."""
 
-from biglinux_swap.ui.memory_chart import MemoryChartWidget
-from biglinux_swap.ui.unified_view import UnifiedView
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from biglinux_swap.ui.memory_chart import MemoryChartWidget
+    from biglinux_swap.ui.unified_view import UnifiedView
+
+# Public names resolved on first access (PEP 562): name -> submodule
+_LAZY_EXPORTS: dict[str, str] = {
+    "MemoryChartWidget": "biglinux_swap.ui.memory_chart",
+    "UnifiedView": "biglinux_swap.ui.unified_view",
+}
 
 __all__ = [
     "MemoryChartWidget",
     "UnifiedView",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Import UI classes lazily so loading one submodule doesn't load them all."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -7,13 +7,57 @@ Factory functions for creating consistent Adwaita widgets.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
-import gi
+from biglinux_swap._gi_bootstrap import Adw, Gtk
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gtk
+# GI enum values resolved once instead of on every factory call
+_CENTER = Gtk.Align.CENTER
+_HORIZONTAL = Gtk.Orientation.HORIZONTAL
+
+# =============================================================================
+# Signal Adapters (shared by all rows; the user callback is passed as user_data)
+# =============================================================================
+
+
+def _on_switch_active(
+    switch: Gtk.Switch, _pspec: object, callback: Callable[[bool], None]
+) -> None:
+    callback(switch.get_active())
+
+
+def _on_scale_value_changed(
+    scale: Gtk.Scale, callback: Callable[[float], None]
+) -> None:
+    callback(scale.get_value())
+
+
+def _on_combo_selected(
+    row: Adw.ComboRow, _pspec: object, callback: Callable[[int], None]
+) -> None:
+    callback(row.get_selected())
+
+
+# =============================================================================
+# Shared Models
+# =============================================================================
+
+# Read-only combo models, one per distinct option set (never mutate these)
+_STRING_LISTS: dict[tuple[str, ...], Gtk.StringList] = {}
+
+
+def _get_string_list(options: Sequence[str]) -> Gtk.StringList:
+    """Return the shared StringList for an option set, creating it once."""
+    key = tuple(options)
+    model = _STRING_LISTS.get(key)
+    if model is None:
+        model = _STRING_LISTS[key] = Gtk.StringList.new(key)
+    return model
+
+
+# =============================================================================
+# Factories
+# =============================================================================
 
 
 def create_preferences_group(
@@ -21,11 +65,9 @@ def create_preferences_group(
     description: str | None = None,
 ) -> Adw.PreferencesGroup:
     """Create a preferences group with title and optional description."""
-    group = Adw.PreferencesGroup()
-    group.set_title(title)
     if description:
-        group.set_description(description)
-    return group
+        return Adw.PreferencesGroup(title=title, description=description)
+    return Adw.PreferencesGroup(title=title)
 
 
 def create_action_row_with_switch(
@@ -35,17 +77,12 @@ def create_action_row_with_switch(
     on_toggled: Callable[[bool], None] | None = None,
 ) -> tuple[Adw.ActionRow, Gtk.Switch]:
     """Create an action row with a switch."""
-    row = Adw.ActionRow()
-    row.set_title(title)
-    if subtitle:
-        row.set_subtitle(subtitle)
+    row = Adw.ActionRow(title=title, subtitle=subtitle or "")
 
-    switch = Gtk.Switch()
-    switch.set_active(active)
-    switch.set_valign(Gtk.Align.CENTER)
+    switch = Gtk.Switch(active=active, valign=_CENTER)
 
     if on_toggled:
-        switch.connect("notify::active", lambda s, _: on_toggled(s.get_active()))
+        switch.connect("notify::active", _on_switch_active, on_toggled)
 
     row.add_suffix(switch)
     row.set_activatable_widget(switch)
@@ -62,33 +99,34 @@ def create_action_row_with_scale(
     digits: int = 0,
     on_changed: Callable[[float], None] | None = None,
     show_value: bool = True,
+    adjustment: Gtk.Adjustment | None = None,
 ) -> tuple[Adw.ActionRow, Gtk.Scale]:
-    """Create an action row with a horizontal scale slider."""
-    row = Adw.ActionRow()
-    row.set_title(title)
-    if subtitle:
-        row.set_subtitle(subtitle)
-
-    adjustment = Gtk.Adjustment(
-        value=value,
-        lower=min_value,
-        upper=max_value,
-        step_increment=step,
-        page_increment=step * 10,
-    )
+    """
+    Create an action row with a horizontal scale slider.
+
+    Pass an existing ``adjustment`` to share it with other widgets; the
+    range/value/step arguments are then ignored.
+    """
+    row = Adw.ActionRow(title=title, subtitle=subtitle or "")
+
+    if adjustment is None:
+        # value, lower, upper, step_increment, page_increment, page_size
+        adjustment = Gtk.Adjustment.new(
+            value, min_value, max_value, step, step * 10, 0.0
+        )
 
     scale = Gtk.Scale(
-        orientation=Gtk.Orientation.HORIZONTAL,
+        orientation=_HORIZONTAL,
         adjustment=adjustment,
+        digits=digits,
+        hexpand=True,
+        width_request=200,
+        valign=_CENTER,
+        draw_value=show_value,
     )
-    scale.set_digits(digits)
-    scale.set_hexpand(True)
-    scale.set_size_request(200, -1)
-    scale.set_valign(Gtk.Align.CENTER)
-    scale.set_draw_value(show_value)
 
     if on_changed:
-        scale.connect("value-changed", lambda s: on_changed(s.get_value()))
+        scale.connect("value-changed", _on_scale_value_changed, on_changed)
 
     row.add_suffix(scale)
     return row, scale
@@ -97,23 +135,19 @@ def create_action_row_with_scale(
 def create_combo_row(
     title: str,
     subtitle: str | None = None,
-    options: list[str] | None = None,
+    options: Sequence[str] | None = None,
     selected_index: int = 0,
     on_selected: Callable[[int], None] | None = None,
 ) -> Adw.ComboRow:
     """Create a combo row with dropdown options."""
-    row = Adw.ComboRow()
-    row.set_title(title)
-    if subtitle:
-        row.set_subtitle(subtitle)
+    row = Adw.ComboRow(title=title, subtitle=subtitle or "")
 
     if options:
-        model = Gtk.StringList.new(options)
-        row.set_model(model)
+        row.set_model(_get_string_list(options))
         row.set_selected(selected_index)
 
     if on_selected:
-        row.connect("notify::selected", lambda r, _: on_selected(r.get_selected()))
+        row.connect("notify::selected", _on_combo_selected, on_selected)
 
     return row
 
@@ -123,13 +157,9 @@ def create_status_row(
     value: str,
 ) -> Adw.ActionRow:
     """Create a status display row (read-only)."""
-    row = Adw.ActionRow()
-    row.set_title(label)
-    row.set_activatable(False)
+    row = Adw.ActionRow(title=label, activatable=False)
 
-    value_label = Gtk.Label(label=value)
-    value_label.add_css_class("dim-label")
-    value_label.set_valign(Gtk.Align.CENTER)
+    value_label = Gtk.Label(label=value, valign=_CENTER, css_classes=["dim-label"])
     row.add_suffix(value_label)
 
     row._value_label = value_label  # type: ignore[attr-defined]
@@ -138,28 +168,25 @@ def create_status_row(
 
 def update_status_row(row: Adw.ActionRow | None, value: str) -> None:
     """Update the value displayed in a status row."""
-    if row and hasattr(row, "_value_label"):
-        row._value_label.set_text(value)  # type: ignore[attr-defined]
+    value_label = getattr(row, "_value_label", None)
+    # Skip unchanged values: set_text always invalidates the Pango layout
+    if value_label is not None and value_label.get_text() != value:
+        value_label.set_text(value)
 
 
 def create_status_indicator(
     active: bool = False,
     label: str | None = None,
-) -> Gtk.Box:
-    """Create a status indicator with colored dot."""
-    box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-    box.set_valign(Gtk.Align.CENTER)
-
-    dot = Gtk.Label(label="●")
-    if active:
-        dot.add_css_class("success")
-    else:
-        dot.add_css_class("dim-label")
-    box.append(dot)
-
-    if label:
-        lbl = Gtk.Label(label=label)
-        lbl.add_css_class("dim-label")
-        box.append(lbl)
-
-    return box
+) -> Gtk.Label:
+    """Create a status indicator: a colored dot, optionally followed by text."""
+    return Gtk.Label(
+        label=f"● {label}" if label else "●",
+        valign=_CENTER,
+        css_classes=["success" if active else "dim-label"],
+    )
+
+
+def set_status_indicator_state(indicator: Gtk.Label, active: bool) -> None:
+    """Restyle a status indicator in place for the given active state."""
+    indicator.remove_css_class("dim-label" if active else "success")
+    indicator.add_css_class("success" if active else "dim-label")
@@ -10,12 +10,9 @@ from __future__ import annotations
 import math
 from collections import deque
 from dataclasses import dataclass
+from typing import NamedTuple
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gtk
+from biglinux_swap._gi_bootstrap import Adw, Gtk
 
 from biglinux_swap.config import CHART_MAX_HISTORY
 from biglinux_swap.i18n import _
@@ -27,7 +24,29 @@ except ImportError:
     cairo = None  # type: ignore[assignment]
 
 
-@dataclass
+# Plot area margins inside the widget
+_MARGIN_LEFT = 45
+_MARGIN_RIGHT = 10
+_MARGIN_TOP = 15
+_MARGIN_BOTTOM = 30
+
+# Full circle for the hover markers
+_TWO_PI = math.tau
+
+
+class _ChartGeometry(NamedTuple):
+    """Plot layout derived from widget size and number of points."""
+
+    chart_width: float
+    chart_height: float
+    x_step: float
+    start_x: float  # x of the oldest point (history is right-aligned)
+    y_bottom: float  # y of the 0% baseline
+    y_scale: float  # pixels per percentage point
+    xs: tuple[float, ...]  # x of each point, snapped to pixel centres
+
+
+@dataclass(slots=True, frozen=True)
 class MemoryDataPoint:
     """Single data point for memory chart."""
 
@@ -55,7 +74,15 @@ class MemoryChartWidget(Gtk.DrawingArea):
         """Initialize the memory chart widget."""
         super().__init__()
 
-        self._history: deque[MemoryDataPoint] = deque(maxlen=CHART_MAX_HISTORY)
+        # History as parallel per-series buffers (oldest first), so drawing
+        # walks plain floats instead of unpacking one object per point
+        self._mem_series: deque[float] = deque(maxlen=CHART_MAX_HISTORY)
+        self._swap_series: deque[float] = deque(maxlen=CHART_MAX_HISTORY)
+        self._zswap_series: deque[float] = deque(maxlen=CHART_MAX_HISTORY)
+        # Tooltip texts (mem, swap, zswap), index-aligned with the series
+        self._text_history: deque[tuple[str, str, str]] = deque(
+            maxlen=CHART_MAX_HISTORY
+        )
 
         # Current values for display
         self._mem_used_text = ""
@@ -66,6 +93,21 @@ class MemoryChartWidget(Gtk.DrawingArea):
         self._hover_x: float | None = None
         self._hover_index: int | None = None
 
+        # Pre-rendered background/grid: (width, height, scale, is_dark, surface)
+        self._bg_cache: tuple[int, int, int, bool, cairo.ImageSurface] | None = None
+        # Pre-rendered chart without hover overlay: (key, surface); the key
+        # includes _history_version, bumped whenever the data changes
+        self._chart_cache: tuple[tuple, cairo.ImageSurface] | None = None
+        self._history_version = 0
+        # Font face resolved on first draw and reused afterwards
+        self._font_face: cairo.ToyFontFace | None = None
+        # text_extents results keyed by (font size, text)
+        self._extents_cache: dict[tuple[int, str], cairo.TextExtents] = {}
+        # Memoized layout: ((width, height, num_points), geometry)
+        self._geom_cache: tuple[tuple[int, int, int], _ChartGeometry] | None = None
+        # Last tooltip: (hover index, history version, text, extents)
+        self._tooltip_cache: tuple[int, int, str, cairo.TextExtents] | None = None
+
         # Sizing
         self.set_size_request(300, 150)
         self.set_vexpand(False)
@@ -100,28 +142,42 @@ class MemoryChartWidget(Gtk.DrawingArea):
             zswap_percent: Zswap pool as percentage of RAM (0-100)
             zswap_text: Formatted text for zswap pool size
         """
-        point = MemoryDataPoint(
-            mem_used_percent=min(100.0, max(0.0, mem_used_percent)),
-            swap_used_percent=min(100.0, max(0.0, swap_used_percent)),
-            zswap_percent=min(100.0, max(0.0, zswap_percent)),
-            mem_text=mem_used_text,
-            swap_text=swap_used_text,
-            zswap_text=zswap_text,
-        )
-        self._history.append(point)
+        # Clamp to 0-100 with comparisons rather than min()/max() calls
+        m, s, z = mem_used_percent, swap_used_percent, zswap_percent
+        self._mem_series.append(0.0 if m < 0.0 else (100.0 if m > 100.0 else m))
+        self._swap_series.append(0.0 if s < 0.0 else (100.0 if s > 100.0 else s))
+        self._zswap_series.append(0.0 if z < 0.0 else (100.0 if z > 100.0 else z))
+        self._text_history.append((mem_used_text, swap_used_text, zswap_text))
         self._mem_used_text = mem_used_text
         self._swap_used_text = swap_used_text
         self._zswap_text = zswap_text
+        self._history_version += 1
         self.queue_draw()
 
     def clear(self) -> None:
         """Clear all data points."""
-        self._history.clear()
+        self._mem_series.clear()
+        self._swap_series.clear()
+        self._zswap_series.clear()
+        self._text_history.clear()
         self._mem_used_text = ""
         self._swap_used_text = ""
         self._zswap_text = ""
+        self._history_version += 1
         self.queue_draw()
 
+    def _point_at(self, index: int) -> MemoryDataPoint:
+        """Assemble the data point stored at a history index."""
+        mem_text, swap_text, zswap_text = self._text_history[index]
+        return MemoryDataPoint(
+            mem_used_percent=self._mem_series[index],
+            swap_used_percent=self._swap_series[index],
+            zswap_percent=self._zswap_series[index],
+            mem_text=mem_text,
+            swap_text=swap_text,
+            zswap_text=zswap_text,
+        )
+
     def _on_motion(
         self,
         controller: Gtk.EventControllerMotion,
@@ -143,36 +199,58 @@ class MemoryChartWidget(Gtk.DrawingArea):
 
     def _update_hover_index(self) -> None:
         """Calculate which data point the mouse is hovering over."""
-        if self._hover_x is None or not self._history:
+        if self._hover_x is None or not self._mem_series:
             self._hover_index = None
             return
 
         # Get widget dimensions
         width = self.get_width()
-        margin_left = 45
-        margin_right = 10
-        chart_width = width - margin_left - margin_right
+        num_points = len(self._mem_series)
+        geom = self._get_geometry(width, self.get_height(), num_points)
 
-        if chart_width <= 0:
+        if geom.chart_width <= 0:
             self._hover_index = None
             return
 
         # Check if mouse is within chart area
-        if self._hover_x < margin_left or self._hover_x > width - margin_right:
+        if self._hover_x < _MARGIN_LEFT or self._hover_x > width - _MARGIN_RIGHT:
             self._hover_index = None
             return
 
-        # Calculate which point the mouse is near
-        num_points = len(self._history)
-        x_step = chart_width / max(CHART_MAX_HISTORY - 1, 1)
-        start_x = margin_left + chart_width - (num_points - 1) * x_step
-
-        # Find closest point
-        relative_x = self._hover_x - start_x
-        index = round(relative_x / x_step) if x_step > 0 else 0
-        index = max(0, min(num_points - 1, index))
+        # Find closest point (round half up; negatives are clamped below)
+        x_step = geom.x_step
+        relative_x = self._hover_x - geom.start_x
+        index = int(relative_x / x_step + 0.5) if x_step > 0 else 0
+        if index < 0:
+            index = 0
+        elif index >= num_points:
+            index = num_points - 1
         self._hover_index = index
 
+    def _get_geometry(self, width: int, height: int, num_points: int) -> _ChartGeometry:
+        """Return the plot geometry, recomputing only when its inputs change."""
+        key = (width, height, num_points)
+        cached = self._geom_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        chart_width = width - _MARGIN_LEFT - _MARGIN_RIGHT
+        chart_height = height - _MARGIN_TOP - _MARGIN_BOTTOM
+        x_step = chart_width / max(CHART_MAX_HISTORY - 1, 1)
+        start_x = _MARGIN_LEFT + chart_width - (num_points - 1) * x_step
+        geom = _ChartGeometry(
+            chart_width=chart_width,
+            chart_height=chart_height,
+            x_step=x_step,
+            start_x=start_x,
+            y_bottom=_MARGIN_TOP + chart_height,
+            y_scale=chart_height / 100,
+            # Whole pixel + 0.5 keeps vertices and 1px lines on the pixel grid
+            xs=tuple(int(start_x + i * x_step) + 0.5 for i in range(num_points)),
+        )
+        self._geom_cache = (key, geom)
+        return geom
+
     def _on_draw(
         self,
         area: Gtk.DrawingArea,
@@ -181,80 +259,74 @@ class MemoryChartWidget(Gtk.DrawingArea):
         height: int,
     ) -> None:
         """Draw the chart using Cairo."""
+        if cairo is None:
+            return
+        if self._font_face is None:
+            self._font_face = cairo.ToyFontFace(
+                "Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
+            )
+
         # Theme detection
         style_manager = Adw.StyleManager.get_default()
         is_dark = style_manager.get_dark()
 
-        if is_dark:
-            bg_color = (0.0, 0.0, 0.0, 1.0)
-            grid_color = (0.3, 0.3, 0.3, 0.5)
-            text_color = (0.9, 0.9, 0.9, 1.0)
-        else:
-            bg_color = (0.12, 0.12, 0.12, 1.0)
-            grid_color = (0.3, 0.3, 0.3, 0.5)
-            text_color = (0.9, 0.9, 0.9, 1.0)
-
-        # Convert history to list once for performance
-        history_list = list(self._history)
-
-        # Rounded rectangle background
-        radius = 12.0
-        self._draw_rounded_rect(cr, 0, 0, width, height, radius)
-        cr.set_source_rgba(*bg_color)
-        cr.fill()
-
-        # Clip to rounded rectangle so all drawing respects corners
-        self._draw_rounded_rect(cr, 0, 0, width, height, radius)
-        cr.clip()
-
-        # Margins
-        margin_left = 45
-        margin_right = 10
-        margin_top = 15
-        margin_bottom = 30
-
-        chart_width = width - margin_left - margin_right
-        chart_height = height - margin_top - margin_bottom
+        # Everything except the hover overlay only changes with data/size/theme,
+        # so pointer motion just repaints the cached chart plus the overlay
+        cr.set_source_surface(self._get_chart_surface(width, height, is_dark), 0, 0)
+        cr.paint()
+
+        num_points = len(self._mem_series)
+        if self._hover_index is not None and 0 <= self._hover_index < num_points:
+            self._draw_hover(cr, width, height, num_points, self._hover_index)
+
+    def _get_chart_surface(
+        self, width: int, height: int, is_dark: bool
+    ) -> cairo.ImageSurface:
+        """Return the cached chart (without hover), re-rendering it if stale."""
+        scale = self.get_scale_factor()
+        key = (width, height, scale, is_dark, self._history_version)
+        cached = self._chart_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, max(1, width * scale), max(1, height * scale)
+        )
+        surface.set_device_scale(scale, scale)
+        cr = cairo.Context(surface)
+        # Background, grid and axis labels only change with size/theme
+        cr.set_source_surface(self._get_background(width, height, is_dark), 0, 0)
+        cr.paint()
+        self._render_chart(cr, width, height)
+        self._chart_cache = (key, surface)
+        return surface
+
+    def _render_chart(self, cr: cairo.Context, width: int, height: int) -> None:
+        """Draw the data lines and legend on top of the background."""
+        text_color = (0.9, 0.9, 0.9, 1.0)
+
+        margin_left = _MARGIN_LEFT
+        margin_top = _MARGIN_TOP
+
+        num_points = len(self._mem_series)
+        geom = self._get_geometry(width, height, num_points)
+        chart_width = geom.chart_width
+        chart_height = geom.chart_height
 
         if chart_width <= 0 or chart_height <= 0:
             return
 
-        # Draw grid lines
-        cr.set_source_rgba(*grid_color)
-        cr.set_line_width(1)
-
-        for percent in [25, 50, 75, 100]:
-            y = margin_top + chart_height * (1 - percent / 100)
-            cr.move_to(margin_left, y)
-            cr.line_to(margin_left + chart_width, y)
-            cr.stroke()
-
-            # Label
-            cr.set_source_rgba(0.6, 0.6, 0.6, 1)
-            cr.select_font_face(
-                "Sans", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_NORMAL
-            )
-            cr.set_font_size(10)
-            cr.move_to(5, y + 4)
-            cr.show_text(f"{percent}%")
-
-        # Draw 0% line
-        y_zero = margin_top + chart_height
-        cr.set_source_rgba(*grid_color)
-        cr.move_to(margin_left, y_zero)
-        cr.line_to(margin_left + chart_width, y_zero)
-        cr.stroke()
-
-        cr.set_source_rgba(0.6, 0.6, 0.6, 1)
-        cr.move_to(5, y_zero + 4)
-        cr.show_text("0%")
+        # Clip to rounded rectangle so all drawing respects corners
+        self._draw_rounded_rect(cr, 0, 0, width, height, 12.0)
+        cr.clip()
+        cr.set_font_face(self._font_face)
 
-        if not self._history:
+        if not num_points:
             # No data - show placeholder text
             cr.set_source_rgba(0.5, 0.5, 0.5, 1)
             cr.set_font_size(14)
             text = _("Collecting data...")
-            extents = cr.text_extents(text)
+            extents = self._text_extents(cr, 14, text)
             cr.move_to(
                 margin_left + (chart_width - extents.width) / 2,
                 margin_top + chart_height / 2,
@@ -264,17 +336,20 @@ class MemoryChartWidget(Gtk.DrawingArea):
 
         # Check if we have swap data (not just zswap, but any swap configuration)
         # If the last point has swap text other than empty/"N/A", we show 3-line layout
-        last_point = history_list[-1] if history_list else None
-        has_swap = last_point and last_point.swap_text and last_point.swap_text != "N/A"
+        has_swap = self._swap_used_text and self._swap_used_text != "N/A"
+
+        # X positions and y scaling shared by all three series
+        xs = geom.xs
+        y_bottom = geom.y_bottom
+        y_scale = geom.y_scale
 
         # Draw RAM line (green)
         self._draw_line(
             cr,
-            chart_width,
-            chart_height,
-            margin_left,
-            margin_top,
-            [p.mem_used_percent for p in self._history],
+            xs,
+            y_bottom,
+            y_scale,
+            self._mem_series,
             (0.3, 0.85, 0.4, 1.0),  # Green
         )
 
@@ -282,22 +357,20 @@ class MemoryChartWidget(Gtk.DrawingArea):
         if has_swap:
             self._draw_line(
                 cr,
-                chart_width,
-                chart_height,
-                margin_left,
-                margin_top,
-                [p.zswap_percent for p in self._history],
+                xs,
+                y_bottom,
+                y_scale,
+                self._zswap_series,
                 (0.95, 0.6, 0.2, 1.0),  # Orange
             )
 
         # Draw Swap line (blue)
         self._draw_line(
             cr,
-            chart_width,
-            chart_height,
-            margin_left,
-            margin_top,
-            [p.swap_used_percent for p in self._history],
+            xs,
+            y_bottom,
+            y_scale,
+            self._swap_series,
             (0.3, 0.5, 0.95, 1.0),  # Blue
         )
 
@@ -379,89 +452,180 @@ class MemoryChartWidget(Gtk.DrawingArea):
             )
             cr.show_text(swap_text)
 
-        # Draw hover indicator and tooltip
-        if self._hover_index is not None and 0 <= self._hover_index < len(
-            self._history
-        ):
-            point = history_list[self._hover_index]
-            num_points = len(self._history)
-            x_step = chart_width / max(CHART_MAX_HISTORY - 1, 1)
-            start_x = margin_left + chart_width - (num_points - 1) * x_step
-            hover_x = start_x + self._hover_index * x_step
-
-            # Vertical line
-            cr.set_source_rgba(1, 1, 1, 0.3)
-            cr.set_line_width(1)
-            cr.move_to(hover_x, margin_top)
-            cr.line_to(hover_x, margin_top + chart_height)
-            cr.stroke()
-
-            # RAM point
-            ram_y = margin_top + chart_height * (1 - point.mem_used_percent / 100)
-            cr.set_source_rgba(0.3, 0.85, 0.4, 1.0)
-            cr.arc(hover_x, ram_y, 4, 0, 2 * math.pi)
-            cr.fill()
+    def _draw_hover(
+        self, cr: cairo.Context, width: int, height: int, num_points: int, index: int
+    ) -> None:
+        """Draw the hover line, point markers and tooltip."""
+        margin_right = _MARGIN_RIGHT
+        margin_top = _MARGIN_TOP
 
-            # Zswap point (if data exists)
-            if point.zswap_percent > 0:
-                zswap_y = margin_top + chart_height * (1 - point.zswap_percent / 100)
-                cr.set_source_rgba(0.95, 0.6, 0.2, 1.0)
-                cr.arc(hover_x, zswap_y, 4, 0, 2 * math.pi)
-                cr.fill()
+        geom = self._get_geometry(width, height, num_points)
+        chart_width = geom.chart_width
+        chart_height = geom.chart_height
 
-            # Swap point
-            swap_y = margin_top + chart_height * (1 - point.swap_used_percent / 100)
-            cr.set_source_rgba(0.3, 0.5, 0.95, 1.0)
-            cr.arc(hover_x, swap_y, 4, 0, 2 * math.pi)
+        if chart_width <= 0 or chart_height <= 0:
+            return
+
+        # Clip to rounded rectangle so all drawing respects corners
+        self._draw_rounded_rect(cr, 0, 0, width, height, 12.0)
+        cr.clip()
+        cr.set_font_face(self._font_face)
+
+        point = self._point_at(index)
+        hover_x = geom.xs[index]
+
+        # Vertical line
+        cr.set_source_rgba(1, 1, 1, 0.3)
+        cr.set_line_width(1)
+        cr.move_to(hover_x, margin_top)
+        cr.line_to(hover_x, geom.y_bottom)
+        cr.stroke()
+
+        # RAM point
+        ram_y = geom.y_bottom - point.mem_used_percent * geom.y_scale
+        cr.set_source_rgba(0.3, 0.85, 0.4, 1.0)
+        cr.arc(hover_x, ram_y, 4, 0, _TWO_PI)
+        cr.fill()
+
+        # Zswap point (if data exists)
+        if point.zswap_percent > 0:
+            zswap_y = geom.y_bottom - point.zswap_percent * geom.y_scale
+            cr.set_source_rgba(0.95, 0.6, 0.2, 1.0)
+            cr.arc(hover_x, zswap_y, 4, 0, _TWO_PI)
             cr.fill()
 
-            # Calculate how many seconds ago this reading was
-            seconds_ago = num_points - self._hover_index - 1
+        # Swap point
+        swap_y = geom.y_bottom - point.swap_used_percent * geom.y_scale
+        cr.set_source_rgba(0.3, 0.5, 0.95, 1.0)
+        cr.arc(hover_x, swap_y, 4, 0, _TWO_PI)
+        cr.fill()
 
-            # Build tooltip text with absolute values and time
-            time_text = (
-                _("{}s ago").format(seconds_ago) if seconds_ago > 0 else _("now")
+        cr.set_font_size(10)
+        # Text and size only change with the hovered index or the history
+        cached = self._tooltip_cache
+        if cached is not None and cached[:2] == (index, self._history_version):
+            tooltip_text, extents = cached[2], cached[3]
+        else:
+            tooltip_text = self._build_tooltip_text(point, num_points - index - 1)
+            extents = self._text_extents(cr, 10, tooltip_text)
+            self._tooltip_cache = (
+                index,
+                self._history_version,
+                tooltip_text,
+                extents,
             )
-            # Always show Swap RAM and Swap Disk when swap is configured
-            has_swap_text = point.swap_text and point.swap_text != "N/A"
-            if has_swap_text:
-                zswap_display = point.zswap_text if point.zswap_text else "0 B"
-                tooltip_text = _("[{}]  RAM: {}  Swap RAM: {}  Swap Disk: {}").format(
-                    time_text, point.mem_text, zswap_display, point.swap_text
-                )
-            elif point.mem_text:
-                tooltip_text = _("[{}]  RAM: {}").format(time_text, point.mem_text)
-            else:
-                # Fallback to percentages if no text available
-                tooltip_text = _("[{}]  RAM: {}%").format(
-                    time_text, f"{point.mem_used_percent:.1f}"
-                )
-            cr.set_font_size(10)
-            extents = cr.text_extents(tooltip_text)
 
-            # Fixed position: top-right corner
-            tooltip_x = width - margin_right - extents.width - 10
-            tooltip_y = margin_top + 5
+        # Fixed position: top-right corner
+        tooltip_x = width - margin_right - extents.width - 10
+        tooltip_y = margin_top + 5
 
-            # Background
-            cr.set_source_rgba(0.15, 0.15, 0.15, 0.95)
-            cr.rectangle(
-                tooltip_x - 5, tooltip_y - 3, extents.width + 10, extents.height + 8
-            )
-            cr.fill()
+        # Background and border share one rectangle path
+        cr.rectangle(
+            tooltip_x - 5, tooltip_y - 3, extents.width + 10, extents.height + 8
+        )
+        cr.set_source_rgba(0.15, 0.15, 0.15, 0.95)
+        cr.fill_preserve()
+        cr.set_source_rgba(0.4, 0.4, 0.4, 1)
+        cr.set_line_width(1)
+        cr.stroke()
 
-            # Border
-            cr.set_source_rgba(0.4, 0.4, 0.4, 1)
-            cr.set_line_width(1)
-            cr.rectangle(
-                tooltip_x - 5, tooltip_y - 3, extents.width + 10, extents.height + 8
+        # Text
+        cr.set_source_rgba(0.95, 0.95, 0.95, 1)
+        cr.move_to(tooltip_x, tooltip_y + extents.height)
+        cr.show_text(tooltip_text)
+
+    def _build_tooltip_text(self, point: MemoryDataPoint, seconds_ago: int) -> str:
+        """Format the hover tooltip for a data point read seconds_ago."""
+        time_text = _("{}s ago").format(seconds_ago) if seconds_ago > 0 else _("now")
+        # Always show Swap RAM and Swap Disk when swap is configured
+        has_swap_text = point.swap_text and point.swap_text != "N/A"
+        if has_swap_text:
+            zswap_display = point.zswap_text if point.zswap_text else "0 B"
+            return _("[{}]  RAM: {}  Swap RAM: {}  Swap Disk: {}").format(
+                time_text, point.mem_text, zswap_display, point.swap_text
             )
-            cr.stroke()
+        if point.mem_text:
+            return _("[{}]  RAM: {}").format(time_text, point.mem_text)
+        # Fallback to percentages if no text available
+        return _("[{}]  RAM: {}%").format(time_text, f"{point.mem_used_percent:.1f}")
+
+    def _get_background(
+        self, width: int, height: int, is_dark: bool
+    ) -> cairo.ImageSurface:
+        """Return the cached background surface, re-rendering it if stale."""
+        scale = self.get_scale_factor()
+        cached = self._bg_cache
+        if cached is not None and cached[:4] == (width, height, scale, is_dark):
+            return cached[4]
+
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32, max(1, width * scale), max(1, height * scale)
+        )
+        surface.set_device_scale(scale, scale)
+        self._render_background(cairo.Context(surface), width, height, is_dark)
+        self._bg_cache = (width, height, scale, is_dark, surface)
+        return surface
 
-            # Text
-            cr.set_source_rgba(0.95, 0.95, 0.95, 1)
-            cr.move_to(tooltip_x, tooltip_y + extents.height)
-            cr.show_text(tooltip_text)
+    def _render_background(
+        self, cr: cairo.Context, width: int, height: int, is_dark: bool
+    ) -> None:
+        """Draw the rounded background, grid lines and percentage labels."""
+        bg_color = (0.0, 0.0, 0.0, 1.0) if is_dark else (0.12, 0.12, 0.12, 1.0)
+        grid_color = (0.3, 0.3, 0.3, 0.5)
+
+        # Rounded rectangle background
+        radius = 12.0
+        self._draw_rounded_rect(cr, 0, 0, width, height, radius)
+        cr.set_source_rgba(*bg_color)
+        cr.fill_preserve()
+
+        # Clip to rounded rectangle so all drawing respects corners
+        cr.clip()
+
+        margin_left = _MARGIN_LEFT
+        margin_top = _MARGIN_TOP
+
+        chart_width = width - _MARGIN_LEFT - _MARGIN_RIGHT
+        chart_height = height - _MARGIN_TOP - _MARGIN_BOTTOM
+
+        if chart_width <= 0 or chart_height <= 0:
+            return
+
+        percents = (0, 25, 50, 75, 100)
+        ys = [margin_top + chart_height * (1 - percent / 100) for percent in percents]
+
+        # Grid lines: one path, one stroke
+        cr.set_source_rgba(*grid_color)
+        cr.set_line_width(1)
+        for y in ys:
+            cr.move_to(margin_left, y)
+            cr.line_to(margin_left + chart_width, y)
+        cr.stroke()
+
+        # Labels: one source color for all of them
+        cr.set_source_rgba(0.6, 0.6, 0.6, 1)
+        cr.set_font_face(self._font_face)
+        cr.set_font_size(10)
+        for percent, y in zip(percents, ys):
+            cr.move_to(5, y + 4)
+            cr.show_text(f"{percent}%")
+
+    def _text_extents(
+        self, cr: cairo.Context, size: int, text: str
+    ) -> cairo.TextExtents:
+        """Measure text with the chart font, caching the result.
+
+        The font size must already be set on cr.
+        """
+        key = (size, text)
+        extents = self._extents_cache.get(key)
+        if extents is None:
+            # Tooltips embed changing values; keep the cache small
+            if len(self._extents_cache) >= 128:
+                self._extents_cache.clear()
+            extents = cr.text_extents(text)
+            self._extents_cache[key] = extents
+        return extents
 
     @staticmethod
     def _draw_rounded_rect(
@@ -483,11 +647,10 @@ class MemoryChartWidget(Gtk.DrawingArea):
     def _draw_line(
         self,
         cr: cairo.Context,
-        chart_width: float,
-        chart_height: float,
-        margin_left: float,
-        margin_top: float,
-        values: list[float],
+        xs: tuple[float, ...],
+        y_bottom: float,
+        y_scale: float,
+        values: deque[float],
         color: tuple[float, float, float, float],
     ) -> None:
         """
@@ -495,51 +658,34 @@ class MemoryChartWidget(Gtk.DrawingArea):
 
         Args:
             cr: Cairo context
-            chart_width: Width of chart area
-            chart_height: Height of chart area
-            margin_left: Left margin
-            margin_top: Top margin
-            values: List of values (0-100)
+            xs: Precomputed x position for each value
+            y_bottom: Y coordinate of the 0% baseline
+            y_scale: Pixels per percentage point
+            values: Series values, oldest first (0-100)
             color: RGBA color tuple
         """
         if not values:
             return
 
+        ys = [y_bottom - value * y_scale for value in values]
+        move_to = cr.move_to
+        line_to = cr.line_to
+
         cr.set_source_rgba(*color)
         cr.set_line_width(2)
 
-        num_points = len(values)
-        x_step = chart_width / max(CHART_MAX_HISTORY - 1, 1)
-
-        # Start from the right side
-        start_x = margin_left + chart_width - (num_points - 1) * x_step
+        # Build the polyline once; stroke_preserve keeps it for the fill
+        move_to(xs[0], ys[0])
+        for i in range(1, len(ys)):
+            line_to(xs[i], ys[i])
 
-        for i, value in enumerate(values):
-            x = start_x + i * x_step
-            y = margin_top + chart_height * (1 - value / 100)
-
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-
-        cr.stroke()
+        cr.stroke_preserve()
 
         # Draw area fill with transparency
         cr.set_source_rgba(color[0], color[1], color[2], 0.15)
 
-        # Start again for fill
-        for i, value in enumerate(values):
-            x = start_x + i * x_step
-            y = margin_top + chart_height * (1 - value / 100)
-
-            if i == 0:
-                cr.move_to(x, y)
-            else:
-                cr.line_to(x, y)
-
         # Close path to bottom
-        cr.line_to(start_x + (num_points - 1) * x_step, margin_top + chart_height)
-        cr.line_to(start_x, margin_top + chart_height)
+        cr.line_to(xs[-1], y_bottom)
+        cr.line_to(xs[0], y_bottom)
         cr.close_path()
         cr.fill()
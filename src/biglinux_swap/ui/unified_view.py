@@ -15,20 +15,15 @@ import threading
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, GLib, Gtk
+from biglinux_swap._gi_bootstrap import Adw, Gio, GLib, Gtk
 
 from biglinux_swap.config import (
     CHART_UPDATE_INTERVAL_MS,
     CHUNK_SIZE_OPTIONS,
-    COMPRESSOR_NAMES,
-    MGLRU_TTL_NAMES,
-    RECOMPRESS_ALG_NAMES,
-    SWAP_MODE_DESCRIPTIONS,
-    SWAP_MODE_NAMES,
+    COMPRESSOR_LABELS,
+    MGLRU_TTL_LABELS,
+    RECOMPRESS_ALG_LABELS,
+    SWAP_MODE_LABELS,
     ZRAM_MEM_LIMIT_DEFAULT,
     ZRAM_MEM_LIMIT_MAX,
     ZRAM_MEM_LIMIT_MIN,
@@ -52,8 +47,10 @@ from biglinux_swap.ui.components import (
     create_preferences_group,
     create_status_indicator,
     create_status_row,
+    set_status_indicator_state,
     update_status_row,
 )
+from biglinux_swap.formatting import format_bytes
 from biglinux_swap.ui.memory_chart import MemoryChartWidget
 from biglinux_swap.utils import TooltipHelper
 
@@ -63,12 +60,25 @@ if TYPE_CHECKING:
     from biglinux_swap.services import (
         ConfigService,
         MeminfoService,
+        MemoryStats,
         SwapService,
         SwapStatus,
     )
 
 logger = logging.getLogger(__name__)
 
+# Status refresh: fast while live statistics are shown, otherwise only a
+# fallback poll; service state changes arrive through systemd's D-Bus signals.
+# Without a signal (e.g. no system bus), the status and mode rows can lag by
+# up to _STATUS_FALLBACK_SECONDS while the statistics expander is collapsed.
+_STATUS_POLL_SECONDS = 3
+_STATUS_FALLBACK_SECONDS = 60
+_SYSTEMD_BUS_NAME = "org.freedesktop.systemd1"
+_SWAP_UNIT_PATH = "/org/freedesktop/systemd1/unit/systemd_2dswap_2eservice"
+
+# Quiet period before re-checking the config while a slider is dragged
+_CONFIG_CHECK_DELAY_MS = 120
+
 
 class UnifiedView(Adw.Bin):
     """
@@ -109,14 +119,28 @@ class UnifiedView(Adw.Bin):
         self._loading = True
 
         self._status_timer: int = 0
+        self._config_check_timer: int = 0
+        self._status_fetch_pending = False
+        self._map_handlers: list[int] = []
+        self._unit_proxy: Gio.DBusProxy | None = None
+        self._unit_signal_handler: int = 0
+        self._dbus_cancellable: Gio.Cancellable | None = None
 
         self._latest_mem_stats: MemoryStats | None = None
         self._latest_swap_status: SwapStatus | None = None
 
+        # Last values pushed to widgets, to skip no-op updates
+        self._last_is_active: bool | None = None
+        self._rendered_mem_stats: MemoryStats | None = None
+        self._chart_text_key: tuple[int, ...] = ()
+        self._chart_texts: tuple[str, str, str] = ("", "", "")
+        self._visibility_mode: SwapMode | None = None
+        self._stats_visibility: tuple[bool, bool, bool, bool] | None = None
+
         # Widget references
         self._chart: MemoryChartWidget | None = None
         self._status_row: Adw.ActionRow | None = None
-        self._status_indicator: Gtk.Widget | None = None
+        self._status_indicator: Gtk.Label | None = None
         self._mode_status_row: Adw.ActionRow | None = None
 
         # Mode selection
@@ -148,6 +172,7 @@ class UnifiedView(Adw.Bin):
 
         # Advanced expander
         self._advanced_box: Gtk.Box | None = None
+        self._advanced_expander: Adw.ExpanderRow | None = None
         self._advanced_expander_group: Adw.PreferencesGroup | None = None
 
         # Live statistics
@@ -225,6 +250,7 @@ class UnifiedView(Adw.Bin):
         self._stats_expander.set_title(_("Live Statistics"))
         self._stats_expander.set_subtitle(_("Active system usage info"))
         self._stats_expander.set_expanded(False)
+        self._stats_expander.connect("notify::expanded", self._on_stats_expanded)
 
         # --- RAM section ---
         self._stats_ram_total_row = create_status_row(_("RAM Total"), "-")
@@ -295,10 +321,9 @@ class UnifiedView(Adw.Bin):
             _("Choose how swap is managed on your system"),
         )
 
-        mode_names = [SWAP_MODE_NAMES[mode] for mode in SwapMode]
         self._mode_combo = create_combo_row(
             _("Mode"),
-            options=mode_names,
+            options=SWAP_MODE_LABELS,
             on_selected=self._on_mode_changed,
         )
         mode_group.add(self._mode_combo)
@@ -313,7 +338,7 @@ class UnifiedView(Adw.Bin):
         self._mode_description.set_margin_end(16)
         self._mode_description.set_margin_top(4)
         self._mode_description.set_margin_bottom(8)
-        self._mode_description.set_text(SWAP_MODE_DESCRIPTIONS[self._config.mode])
+        self._mode_description.set_text(self._config.mode.description)
 
         # Wrap in a row-like ActionRow for consistent padding
         desc_row = Adw.ActionRow()
@@ -331,23 +356,52 @@ class UnifiedView(Adw.Bin):
         advanced_expander.set_title(_("Advanced Settings"))
         advanced_expander.set_subtitle(_("Fine-tune swap parameters"))
         advanced_expander.set_expanded(False)
+        advanced_expander.connect("notify::expanded", self._on_advanced_expanded)
+        self._advanced_expander = advanced_expander
 
         # We need a nested box inside the expander for groups
         # ExpanderRow only accepts rows, so we wrap groups in ActionRows
+        # Groups are built on first expand by _sync_advanced_groups
         self._advanced_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         self._advanced_box.set_margin_top(8)
         self._advanced_box.set_margin_bottom(8)
 
-        # === ZSWAP ===
+        # Wrap advanced box in a ListBoxRow for the expander
+        wrapper_row = Adw.ActionRow()
+        wrapper_row.set_activatable(False)
+        wrapper_row.set_child(self._advanced_box)
+        advanced_expander.add_row(wrapper_row)
+
+        advanced_expander_group.add(advanced_expander)
+        self._advanced_expander_group = advanced_expander_group
+        parent.append(advanced_expander_group)
+
+        self._update_settings_visibility()
+
+    def _insert_advanced_group(self, group: Adw.PreferencesGroup) -> None:
+        """Insert a lazily built group, keeping zswap/zram/swapfile/mglru order."""
+        previous = None
+        for candidate in (
+            self._zswap_group,
+            self._zram_group,
+            self._swapfile_group,
+            self._mglru_group,
+        ):
+            if candidate is group:
+                break
+            if candidate is not None:
+                previous = candidate
+        self._advanced_box.insert_child_after(group, previous)
+
+    def _build_zswap_group(self) -> None:
         self._zswap_group = create_preferences_group(
             _("Zswap"), _("Compressed RAM cache for swap")
         )
 
-        compressor_names = [COMPRESSOR_NAMES[c] for c in Compressor]
         self._zswap_compressor_combo = create_combo_row(
             _("Compressor"),
             subtitle=_("Compression algorithm"),
-            options=compressor_names,
+            options=COMPRESSOR_LABELS,
             on_selected=self._on_zswap_compressor_changed,
         )
         self._zswap_group.add(self._zswap_compressor_combo)
@@ -362,9 +416,29 @@ class UnifiedView(Adw.Bin):
             on_changed=self._on_zswap_pool_changed,
         )
         self._zswap_group.add(self._zswap_pool_row)
-        self._advanced_box.append(self._zswap_group)
+        self._insert_advanced_group(self._zswap_group)
+
+        tooltips = self._tooltip_helper
+        tooltips.add_tooltip(self._zswap_compressor_combo, "zswap_compressor")
+        tooltips.add_tooltip(self._zswap_pool_row, "zswap_pool")
 
-        # === ZRAM ===
+        # === MGLRU (shown alongside Zswap only) ===
+        if is_mglru_supported():
+            self._mglru_group = create_preferences_group(
+                _("MGLRU Anti-Thrashing"),
+                _("Working set protection"),
+            )
+            self._mglru_combo = create_combo_row(
+                _("Min TTL"),
+                subtitle=_("Protect working set from eviction"),
+                options=MGLRU_TTL_LABELS,
+                on_selected=self._on_mglru_changed,
+            )
+            self._mglru_group.add(self._mglru_combo)
+            self._insert_advanced_group(self._mglru_group)
+            tooltips.add_tooltip(self._mglru_combo, "mglru_ttl")
+
+    def _build_zram_group(self) -> None:
         self._zram_group = create_preferences_group(
             _("Zram"), _("Compressed block device in RAM")
         )
@@ -380,11 +454,10 @@ class UnifiedView(Adw.Bin):
         )
         self._zram_group.add(self._zram_size_row)
 
-        alg_names = [COMPRESSOR_NAMES[c] for c in Compressor]
         self._zram_alg_combo = create_combo_row(
             _("Algorithm"),
             subtitle=_("Compression algorithm"),
-            options=alg_names,
+            options=COMPRESSOR_LABELS,
             on_selected=self._on_zram_alg_changed,
         )
         self._zram_group.add(self._zram_alg_combo)
@@ -413,18 +486,23 @@ class UnifiedView(Adw.Bin):
         )
         self._zram_group.add(self._zram_recompress_row)
 
-        recomp_alg_names = [RECOMPRESS_ALG_NAMES[a] for a in RecompressAlgorithm]
         self._zram_recompress_alg_combo = create_combo_row(
             _("Recompression Algorithm"),
             subtitle=_("Secondary algorithm for better ratio on idle pages"),
-            options=recomp_alg_names,
+            options=RECOMPRESS_ALG_LABELS,
             on_selected=self._on_zram_recompress_alg_changed,
         )
         self._zram_group.add(self._zram_recompress_alg_combo)
+        self._insert_advanced_group(self._zram_group)
 
-        self._advanced_box.append(self._zram_group)
+        tooltips = self._tooltip_helper
+        tooltips.add_tooltip(self._zram_size_row, "zram_size")
+        tooltips.add_tooltip(self._zram_alg_combo, "zram_algorithm")
+        tooltips.add_tooltip(self._zram_mem_limit_row, "zram_mem_limit")
+        tooltips.add_tooltip(self._zram_recompress_row, "zram_recompress")
+        tooltips.add_tooltip(self._zram_recompress_alg_combo, "zram_recompress_alg")
 
-        # === SWAP FILE ===
+    def _build_swapfile_group(self) -> None:
         self._swapfile_group = create_preferences_group(
             _("Swap File"), _("Dynamic swap files on disk")
         )
@@ -446,71 +524,15 @@ class UnifiedView(Adw.Bin):
             on_selected=self._on_swapfile_chunk_changed,
         )
         self._swapfile_group.add(self._swapfile_chunk_combo)
-        self._advanced_box.append(self._swapfile_group)
+        self._insert_advanced_group(self._swapfile_group)
 
-        # === MGLRU (inside Zswap group only) ===
-        self._mglru_group = None
-        self._mglru_combo = None
-        if is_mglru_supported():
-            self._mglru_group = create_preferences_group(
-                _("MGLRU Anti-Thrashing"),
-                _("Working set protection"),
-            )
-            mglru_names = [MGLRU_TTL_NAMES[m] for m in MglruTtl]
-            self._mglru_combo = create_combo_row(
-                _("Min TTL"),
-                subtitle=_("Protect working set from eviction"),
-                options=mglru_names,
-                on_selected=self._on_mglru_changed,
-            )
-            self._mglru_group.add(self._mglru_combo)
-            self._advanced_box.append(self._mglru_group)
-
-        # Wrap advanced box in a ListBoxRow for the expander
-        wrapper_row = Adw.ActionRow()
-        wrapper_row.set_activatable(False)
-        wrapper_row.set_child(self._advanced_box)
-        advanced_expander.add_row(wrapper_row)
-
-        advanced_expander_group.add(advanced_expander)
-        self._advanced_expander_group = advanced_expander_group
-        parent.append(advanced_expander_group)
-
-        self._update_settings_visibility()
+        tooltips = self._tooltip_helper
+        tooltips.add_tooltip(self._swapfile_enabled_row, "swapfile_enabled")
+        tooltips.add_tooltip(self._swapfile_chunk_combo, "swapfile_chunk")
 
     def _setup_tooltips(self) -> None:
         if self._mode_combo:
             self._tooltip_helper.add_tooltip(self._mode_combo, "mode")
-        if self._zswap_compressor_combo:
-            self._tooltip_helper.add_tooltip(
-                self._zswap_compressor_combo, "zswap_compressor"
-            )
-        if self._zswap_pool_row:
-            self._tooltip_helper.add_tooltip(self._zswap_pool_row, "zswap_pool")
-        if self._zram_size_row:
-            self._tooltip_helper.add_tooltip(self._zram_size_row, "zram_size")
-        if self._zram_alg_combo:
-            self._tooltip_helper.add_tooltip(self._zram_alg_combo, "zram_algorithm")
-        if self._zram_mem_limit_row:
-            self._tooltip_helper.add_tooltip(self._zram_mem_limit_row, "zram_mem_limit")
-        if self._zram_recompress_row:
-            self._tooltip_helper.add_tooltip(
-                self._zram_recompress_row, "zram_recompress"
-            )
-        if self._zram_recompress_alg_combo:
-            self._tooltip_helper.add_tooltip(
-                self._zram_recompress_alg_combo, "zram_recompress_alg"
-            )
-        if self._swapfile_enabled_row:
-            self._tooltip_helper.add_tooltip(
-                self._swapfile_enabled_row, "swapfile_enabled"
-            )
-        if self._swapfile_chunk_combo:
-            self._tooltip_helper.add_tooltip(
-                self._swapfile_chunk_combo, "swapfile_chunk"
-            )
-        if self._mglru_combo:
-            self._tooltip_helper.add_tooltip(self._mglru_combo, "mglru_ttl")
         if self._status_row:
             self._tooltip_helper.add_tooltip(self._status_row, "status_service")
         if self._mode_status_row:
@@ -582,7 +604,7 @@ class UnifiedView(Adw.Bin):
         if self._mode_combo:
             self._mode_combo.set_selected(mode_index)
         if self._mode_description:
-            self._mode_description.set_text(SWAP_MODE_DESCRIPTIONS[config.mode])
+            self._mode_description.set_text(config.mode.description)
 
         # Zswap
         compressor_index = list(Compressor).index(config.zswap.compressor)
@@ -633,7 +655,23 @@ class UnifiedView(Adw.Bin):
     def _deep_copy_config(self, config: SwapConfig) -> SwapConfig:
         return copy.deepcopy(config)
 
+    def _queue_config_check(self) -> None:
+        """Coalesce slider drags into one _check_config_changed call."""
+        if self._config_check_timer:
+            GLib.source_remove(self._config_check_timer)
+        self._config_check_timer = GLib.timeout_add(
+            _CONFIG_CHECK_DELAY_MS, self._on_config_check_timeout
+        )
+
+    def _on_config_check_timeout(self) -> bool:
+        self._config_check_timer = 0
+        self._check_config_changed()
+        return False  # GLib.timeout_add: don't repeat
+
     def _check_config_changed(self) -> None:
+        if self._config_check_timer:
+            GLib.source_remove(self._config_check_timer)
+            self._config_check_timer = 0
         if self._loading or not self._on_config_changed:
             return
         has_changes = self._configs_differ()
@@ -644,22 +682,124 @@ class UnifiedView(Adw.Bin):
         return self._config != self._original_config
 
     def _start_monitoring(self) -> None:
+        # Poll only while the view is on screen
+        self._map_handlers = [
+            self.connect("map", self._on_map),
+            self.connect("unmap", self._on_unmap),
+        ]
+        self._watch_service_unit()
+        if self.get_mapped():
+            self._resume_polling()
+
+    def _resume_polling(self) -> None:
         self._meminfo_service.start_monitoring(
             self._on_memory_update,
             CHART_UPDATE_INTERVAL_MS,
         )
-        self._status_timer = GLib.timeout_add(3000, self._update_swap_status)
+        self._schedule_status_timer()
         self._update_swap_status()
 
-    def stop_monitoring(self) -> None:
+    def _pause_polling(self) -> None:
         self._meminfo_service.stop_monitoring()
         if self._status_timer:
             GLib.source_remove(self._status_timer)
             self._status_timer = 0
 
+    def _on_map(self, _widget: Gtk.Widget) -> None:
+        self._resume_polling()
+
+    def _on_unmap(self, _widget: Gtk.Widget) -> None:
+        self._pause_polling()
+
+    def stop_monitoring(self) -> None:
+        for handler_id in self._map_handlers:
+            self.disconnect(handler_id)
+        self._map_handlers = []
+        self._pause_polling()
+        if self._dbus_cancellable:
+            self._dbus_cancellable.cancel()
+            self._dbus_cancellable = None
+        if self._unit_proxy:
+            if self._unit_signal_handler:
+                self._unit_proxy.disconnect(self._unit_signal_handler)
+                self._unit_signal_handler = 0
+            self._call_systemd_manager(self._unit_proxy, "Unsubscribe")
+            self._unit_proxy = None
+
+    def _schedule_status_timer(self) -> None:
+        """(Re)arm the status timer for the current live statistics visibility."""
+        if self._status_timer:
+            GLib.source_remove(self._status_timer)
+        expanded = (
+            self._stats_expander is not None and self._stats_expander.get_expanded()
+        )
+        interval = _STATUS_POLL_SECONDS if expanded else _STATUS_FALLBACK_SECONDS
+        # Second granularity lets GLib coalesce wakeups with other timers
+        self._status_timer = GLib.timeout_add_seconds(
+            interval, self._update_swap_status
+        )
+
+    def _on_stats_expanded(self, expander: Adw.ExpanderRow, _pspec) -> None:
+        if not self._status_timer:
+            return  # Monitoring stopped
+        self._schedule_status_timer()
+        if expander.get_expanded():
+            self._update_swap_status()
+
+    def _watch_service_unit(self) -> None:
+        """Listen for systemd-swap.service state changes over D-Bus."""
+        self._dbus_cancellable = Gio.Cancellable()
+        Gio.DBusProxy.new_for_bus(
+            Gio.BusType.SYSTEM,
+            Gio.DBusProxyFlags.DO_NOT_CONNECT_SIGNALS,
+            None,
+            _SYSTEMD_BUS_NAME,
+            _SWAP_UNIT_PATH,
+            "org.freedesktop.systemd1.Unit",
+            self._dbus_cancellable,
+            self._on_unit_proxy_ready,
+        )
+
+    def _on_unit_proxy_ready(self, _source, result: Gio.AsyncResult) -> None:
+        try:
+            proxy = Gio.DBusProxy.new_for_bus_finish(result)
+        except GLib.Error as e:
+            logger.debug("systemd D-Bus watch unavailable: %s", e.message)
+            return
+        self._unit_proxy = proxy
+        self._unit_signal_handler = proxy.connect(
+            "g-properties-changed", self._on_unit_properties_changed
+        )
+        # systemd only emits PropertiesChanged while some client is subscribed
+        self._call_systemd_manager(proxy, "Subscribe")
+
+    def _call_systemd_manager(self, proxy: Gio.DBusProxy, method: str) -> None:
+        """Fire-and-forget call of a no-argument systemd Manager method."""
+        proxy.get_connection().call(
+            _SYSTEMD_BUS_NAME,
+            "/org/freedesktop/systemd1",
+            "org.freedesktop.systemd1.Manager",
+            method,
+            None,
+            None,
+            Gio.DBusCallFlags.NONE,
+            -1,
+            None,
+            None,
+        )
+
+    def _on_unit_properties_changed(
+        self, _proxy: Gio.DBusProxy, changed: GLib.Variant, _invalidated: list[str]
+    ) -> None:
+        if "ActiveState" in changed.unpack() and self.get_mapped():
+            self._update_swap_status()
+
     def cleanup(self) -> None:
         """Stop monitoring and cleanup resources."""
         self.stop_monitoring()
+        if self._config_check_timer:
+            GLib.source_remove(self._config_check_timer)
+            self._config_check_timer = 0
         if hasattr(self, "_tooltip_helper") and self._tooltip_helper:
             self._tooltip_helper.cleanup()
 
@@ -669,42 +809,61 @@ class UnifiedView(Adw.Bin):
 
         self._latest_mem_stats = stats
 
-        mem_text = f"{stats.mem_used_formatted} / {stats.mem_total_formatted}"
-
-        if stats.swap_total > 0:
-            swap_ram_text = stats.swap_ram_formatted
-            swap_ram_percent = stats.swap_ram_percent
-            swap_disk_text = stats.swap_disk_formatted
-            swap_disk_percent = stats.swap_disk_percent
-
-            self._chart.add_data_point(
-                stats.mem_used_percent,
-                swap_disk_percent,
-                mem_text,
-                swap_disk_text,
-                swap_ram_percent,
-                swap_ram_text,
-            )
+        has_swap = stats.swap_total > 0
+
+        # Reuse the previous strings while the byte counts are unchanged
+        key = (
+            stats.mem_used,
+            stats.mem_total,
+            stats.swap_total,
+            stats.swap_disk_used,
+            stats.swap_in_ram,
+        )
+        if key == self._chart_text_key:
+            mem_text, swap_disk_text, swap_ram_text = self._chart_texts
         else:
-            self._chart.add_data_point(
-                stats.mem_used_percent, 0.0, mem_text, "N/A", 0.0, ""
-            )
+            mem_text = f"{stats.mem_used_formatted} / {stats.mem_total_formatted}"
+            swap_disk_text = stats.swap_disk_formatted if has_swap else "N/A"
+            swap_ram_text = stats.swap_ram_formatted if has_swap else ""
+            self._chart_text_key = key
+            self._chart_texts = (mem_text, swap_disk_text, swap_ram_text)
+
+        self._chart.add_data_point(
+            stats.mem_used_percent,
+            stats.swap_disk_percent if has_swap else 0.0,
+            mem_text,
+            swap_disk_text,
+            stats.swap_ram_percent if has_swap else 0.0,
+            swap_ram_text,
+        )
 
     def _update_swap_status(self) -> bool:
         """Update swap status periodically (runs in GLib main loop)."""
+        if self._status_fetch_pending:
+            return True  # Previous fetch still running; keep timer
+        self._status_fetch_pending = True
+        mem_stats = self._latest_mem_stats
 
         def _fetch_status():
             try:
-                status = self._swap_service.get_status(mem_stats=self._latest_mem_stats)
-                GLib.idle_add(self._apply_status_update, status)
+                status = self._swap_service.get_status(mem_stats=mem_stats)
             except Exception:
-                pass
+                logger.debug("Swap status fetch failed", exc_info=True)
+                status = None
+            GLib.idle_add(self._on_status_fetched, status)
 
         threading.Thread(target=_fetch_status, daemon=True).start()
         return True  # Keep timer running
 
+    def _on_status_fetched(self, status: SwapStatus | None) -> bool:
+        self._status_fetch_pending = False
+        if status is not None:
+            self._apply_status_update(status)
+        return GLib.SOURCE_REMOVE
+
     def _apply_status_update(self, status: SwapStatus) -> bool:
         """Apply status update to UI (must run on main thread)."""
+        previous = self._latest_swap_status
         self._latest_swap_status = status
 
         # Service state
@@ -712,38 +871,29 @@ class UnifiedView(Adw.Bin):
         is_active = status.service_state == ServiceState.ACTIVE
         update_status_row(self._status_row, state_text)
 
-        if self._status_indicator and self._status_row:
-            # Update existing indicator instead of recreating
-            dot = self._status_indicator.get_first_child()
-            if dot:
-                for cls in ["success", "error", "dim-label"]:
-                    dot.remove_css_class(cls)
-                dot.add_css_class("success" if is_active else "dim-label")
+        # Only restyle the indicator when the state actually flips
+        if self._status_indicator and is_active != self._last_is_active:
+            set_status_indicator_state(self._status_indicator, is_active)
+            self._last_is_active = is_active
 
         # Mode
         config = self._config_service.get()
         update_status_row(self._mode_status_row, config.mode.value)
 
-        # Live statistics visibility
-        self._update_live_statistics(status)
-
-        # Update settings visibility for Auto mode
-        if config.mode == SwapMode.AUTO:
-            self._update_settings_visibility()
+        # Live statistics: nothing to do when neither input changed
+        mem_stats = self._latest_mem_stats
+        if status != previous or mem_stats != self._rendered_mem_stats:
+            self._update_live_statistics(status)
+            self._rendered_mem_stats = mem_stats
 
         return False  # GLib.idle_add: don't repeat
 
-    def _format_bytes(self, size_bytes: int) -> str:
-        units = ["B", "KiB", "MiB", "GiB"]
-        size = float(size_bytes)
-        for unit in units[:-1]:
-            if abs(size) < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} {units[-1]}"
-
     def _update_settings_visibility(self) -> None:
         mode = self._config.mode
+        # Visibility depends only on the mode; skip repeat calls for the same one
+        if mode is self._visibility_mode:
+            return
+        self._visibility_mode = mode
 
         # In AUTO or DISABLED mode, hide all advanced settings
         if mode in (SwapMode.AUTO, SwapMode.DISABLED):
@@ -754,11 +904,38 @@ class UnifiedView(Adw.Bin):
         # Show advanced settings for manual modes
         if self._advanced_expander_group:
             self._advanced_expander_group.set_visible(True)
+        self._sync_advanced_groups()
+
+    def _on_advanced_expanded(self, expander: Adw.ExpanderRow, _pspec) -> None:
+        if expander.get_expanded():
+            self._sync_advanced_groups()
 
+    def _sync_advanced_groups(self) -> None:
+        """Show the groups for the current mode, building them once expanded."""
+        mode = self._config.mode
         show_zswap = mode in (SwapMode.ZSWAP_SWAPFILE,)
         show_zram = mode in (SwapMode.ZRAM_SWAPFILE, SwapMode.ZRAM_ONLY)
         show_swapfile = mode in (SwapMode.ZSWAP_SWAPFILE, SwapMode.ZRAM_SWAPFILE)
 
+        # Nothing inside a collapsed expander is on screen yet, so defer
+        # building until the user opens it with this mode selected
+        expanded = (
+            self._advanced_expander is not None
+            and self._advanced_expander.get_expanded()
+        )
+        built = False
+        if expanded and show_zswap and self._zswap_group is None:
+            self._build_zswap_group()
+            built = True
+        if expanded and show_zram and self._zram_group is None:
+            self._build_zram_group()
+            built = True
+        if expanded and show_swapfile and self._swapfile_group is None:
+            self._build_swapfile_group()
+            built = True
+        if built:
+            self._load_state()
+
         if self._zswap_group:
             self._zswap_group.set_visible(show_zswap)
         if self._zram_group:
@@ -770,136 +947,122 @@ class UnifiedView(Adw.Bin):
 
     def _update_live_statistics(self, status: SwapStatus) -> None:
         stats = self._latest_mem_stats
+        # Local aliases: this runs on every status tick
+        upd = update_status_row
+        fmt = format_bytes
+        zs = status.zswap
+        zr = status.zram
+        sf = status.swapfile
 
         # --- RAM info (always visible) ---
         if stats:
-            update_status_row(self._stats_ram_total_row, stats.mem_total_formatted)
-            update_status_row(
+            upd(self._stats_ram_total_row, stats.mem_total_formatted)
+            upd(
                 self._stats_ram_used_row,
                 f"{stats.mem_used_formatted} ({stats.mem_used_percent:.0f}%)",
             )
-            update_status_row(
-                self._stats_ram_available_row, stats.format_size(stats.mem_available)
-            )
+            upd(self._stats_ram_available_row, stats.format_size(stats.mem_available))
             buffers_cache = stats.mem_buffers + stats.mem_cached
-            update_status_row(
-                self._stats_ram_buffers_row, stats.format_size(buffers_cache)
-            )
+            upd(self._stats_ram_buffers_row, stats.format_size(buffers_cache))
 
             # Swap overview
             if stats.swap_total > 0:
-                update_status_row(
+                upd(
                     self._stats_swap_total_row,
                     f"{stats.swap_total_formatted} ({stats.swap_used_percent:.0f}% used)",
                 )
-                update_status_row(self._stats_swap_in_ram_row, stats.swap_ram_formatted)
-                update_status_row(
-                    self._stats_swap_on_disk_row, stats.swap_disk_formatted
-                )
+                upd(self._stats_swap_in_ram_row, stats.swap_ram_formatted)
+                upd(self._stats_swap_on_disk_row, stats.swap_disk_formatted)
             else:
-                update_status_row(self._stats_swap_total_row, _("None"))
-                update_status_row(self._stats_swap_in_ram_row, "-")
-                update_status_row(self._stats_swap_on_disk_row, "-")
+                upd(self._stats_swap_total_row, _("None"))
+                upd(self._stats_swap_in_ram_row, "-")
+                upd(self._stats_swap_on_disk_row, "-")
 
-        # Show/hide swap overview rows
+        # Show/hide rows only when a section's visibility flips
         has_swap = stats is not None and stats.swap_total > 0
-        if self._stats_swap_total_row:
-            self._stats_swap_total_row.set_visible(True)
-        if self._stats_swap_in_ram_row:
-            self._stats_swap_in_ram_row.set_visible(has_swap)
-        if self._stats_swap_on_disk_row:
-            self._stats_swap_on_disk_row.set_visible(has_swap)
+        zswap_visible = zs.enabled
+        zram_visible = zr.enabled
+        swapfile_visible = sf.enabled or sf.file_count > 0
+        visibility = (has_swap, zswap_visible, zram_visible, swapfile_visible)
+        if visibility != self._stats_visibility:
+            self._stats_visibility = visibility
+            self._apply_stats_visibility(*visibility)
 
         has_any_active = False
 
         # --- Zswap ---
-        zswap_visible = status.zswap.enabled
-        if self._stats_zswap_pool_row:
-            self._stats_zswap_pool_row.set_visible(zswap_visible)
-        if self._stats_zswap_stored_row:
-            self._stats_zswap_stored_row.set_visible(zswap_visible)
-        if self._stats_zswap_ratio_row:
-            self._stats_zswap_ratio_row.set_visible(zswap_visible)
         if zswap_visible:
             has_any_active = True
-            pool_text = (
-                self._format_bytes(status.zswap.pool_size_bytes)
-                if status.zswap.pool_size_bytes > 0
-                else "0 B"
-            )
-            stored_text = (
-                self._format_bytes(status.zswap.stored_data_bytes)
-                if status.zswap.stored_data_bytes > 0
-                else "0 B"
-            )
-            update_status_row(self._stats_zswap_pool_row, pool_text)
-            update_status_row(self._stats_zswap_stored_row, stored_text)
+            pool_bytes = zs.pool_size_bytes
+            stored_bytes = zs.stored_data_bytes
+            upd(self._stats_zswap_pool_row, fmt(pool_bytes))
+            upd(self._stats_zswap_stored_row, fmt(stored_bytes))
             # Compression ratio
-            if status.zswap.stored_data_bytes > 0 and status.zswap.pool_size_bytes > 0:
-                ratio = status.zswap.stored_data_bytes / status.zswap.pool_size_bytes
-                update_status_row(self._stats_zswap_ratio_row, f"{ratio:.2f}x")
+            if stored_bytes > 0 and pool_bytes > 0:
+                upd(self._stats_zswap_ratio_row, f"{stored_bytes / pool_bytes:.2f}x")
             else:
-                update_status_row(self._stats_zswap_ratio_row, "-")
+                upd(self._stats_zswap_ratio_row, "-")
 
         # --- Zram ---
-        zram_visible = status.zram.enabled
-        if self._stats_zram_size_row:
-            self._stats_zram_size_row.set_visible(zram_visible)
-        if self._stats_zram_used_row:
-            self._stats_zram_used_row.set_visible(zram_visible)
-        if self._stats_zram_ratio_row:
-            self._stats_zram_ratio_row.set_visible(zram_visible)
         if zram_visible:
             has_any_active = True
-            zram_cap_text = (
-                self._format_bytes(status.zram.total_size_bytes)
-                if status.zram.total_size_bytes > 0
-                else "0 B"
-            )
-            zram_used_text = (
-                self._format_bytes(status.zram.used_bytes)
-                if status.zram.used_bytes > 0
-                else "0 B"
-            )
-            update_status_row(self._stats_zram_size_row, zram_cap_text)
-            update_status_row(self._stats_zram_used_row, zram_used_text)
+            upd(self._stats_zram_size_row, fmt(zr.total_size_bytes))
+            upd(self._stats_zram_used_row, fmt(zr.used_bytes))
             # Zram ratio from stats (used_bytes is real RAM consumed; total_size is virtual)
             if stats and stats.zram_used > 0:
                 # Read zram mm_stat for actual compression ratio
-                zram_ratio = self._read_zram_compression_ratio()
-                update_status_row(self._stats_zram_ratio_row, zram_ratio)
+                upd(self._stats_zram_ratio_row, self._read_zram_compression_ratio())
             else:
-                update_status_row(self._stats_zram_ratio_row, "-")
+                upd(self._stats_zram_ratio_row, "-")
 
         # --- SwapFiles ---
-        swapfile_visible = status.swapfile.enabled or status.swapfile.file_count > 0
-        if self._stats_swapfile_files_row:
-            self._stats_swapfile_files_row.set_visible(swapfile_visible)
         if swapfile_visible:
             has_any_active = True
-            if status.swapfile.files:
-                total_size = sum(f.size_bytes for f in status.swapfile.files)
-                total_used = sum(f.used_bytes for f in status.swapfile.files)
-                files_text = f"{len(status.swapfile.files)} files ({self._format_bytes(total_used)} / {self._format_bytes(total_size)})"
-            else:
+            files = sf.files
+            if files:
+                total_size = sum(f.size_bytes for f in files)
+                total_used = sum(f.used_bytes for f in files)
                 files_text = (
-                    f"{status.swapfile.file_count} / {status.swapfile.max_files}"
+                    f"{len(files)} files ({fmt(total_used)} / {fmt(total_size)})"
                 )
-            update_status_row(self._stats_swapfile_files_row, files_text)
+            else:
+                files_text = f"{sf.file_count} / {sf.max_files}"
+            upd(self._stats_swapfile_files_row, files_text)
 
         if self._stats_expander:
             if not has_any_active:
                 self._stats_expander.set_subtitle(_("No active swap systems"))
             else:
                 active = []
-                if status.zswap.enabled:
+                if zswap_visible:
                     active.append("Zswap")
-                if status.zram.enabled:
+                if zram_visible:
                     active.append("Zram")
                 if swapfile_visible:
                     active.append("Swap File")
                 self._stats_expander.set_subtitle(", ".join(active))
 
+    def _apply_stats_visibility(
+        self,
+        has_swap: bool,
+        zswap_visible: bool,
+        zram_visible: bool,
+        swapfile_visible: bool,
+    ) -> None:
+        for row, visible in (
+            (self._stats_swap_in_ram_row, has_swap),
+            (self._stats_swap_on_disk_row, has_swap),
+            (self._stats_zswap_pool_row, zswap_visible),
+            (self._stats_zswap_stored_row, zswap_visible),
+            (self._stats_zswap_ratio_row, zswap_visible),
+            (self._stats_zram_size_row, zram_visible),
+            (self._stats_zram_used_row, zram_visible),
+            (self._stats_zram_ratio_row, zram_visible),
+            (self._stats_swapfile_files_row, swapfile_visible),
+        ):
+            if row:
+                row.set_visible(visible)
+
     def _read_zram_compression_ratio(self) -> str:
         """Read compression ratio from zram mm_stat."""
         for path in glob.glob("/sys/block/zram*/mm_stat"):
@@ -958,10 +1121,10 @@ class UnifiedView(Adw.Bin):
         if status.zswap.enabled:
             lines.append("")
             lines.append(
-                f"{_('Zswap Pool:')}     {self._format_bytes(status.zswap.pool_size_bytes)}"
+                f"{_('Zswap Pool:')}     {format_bytes(status.zswap.pool_size_bytes)}"
             )
             lines.append(
-                f"{_('Zswap Stored:')}   {self._format_bytes(status.zswap.stored_data_bytes)}"
+                f"{_('Zswap Stored:')}   {format_bytes(status.zswap.stored_data_bytes)}"
             )
             if status.zswap.stored_data_bytes > 0 and status.zswap.pool_size_bytes > 0:
                 ratio = status.zswap.stored_data_bytes / status.zswap.pool_size_bytes
@@ -971,10 +1134,10 @@ class UnifiedView(Adw.Bin):
         if status.zram.enabled:
             lines.append("")
             lines.append(
-                f"{_('Zram Capacity:')}  {self._format_bytes(status.zram.total_size_bytes)}"
+                f"{_('Zram Capacity:')}  {format_bytes(status.zram.total_size_bytes)}"
             )
             lines.append(
-                f"{_('Zram Used:')}      {self._format_bytes(status.zram.used_bytes)}"
+                f"{_('Zram Used:')}      {format_bytes(status.zram.used_bytes)}"
             )
             lines.append(
                 f"{_('Zram Ratio:')}     {self._read_zram_compression_ratio()}"
@@ -985,7 +1148,7 @@ class UnifiedView(Adw.Bin):
             total_size = sum(f.size_bytes for f in status.swapfile.files)
             total_used = sum(f.used_bytes for f in status.swapfile.files)
             lines.append(
-                f"{_('Swap Files:')}     {len(status.swapfile.files)} ({self._format_bytes(total_used)} / {self._format_bytes(total_size)})"
+                f"{_('Swap Files:')}     {len(status.swapfile.files)} ({format_bytes(total_used)} / {format_bytes(total_size)})"
             )
 
         text = "\n".join(lines)
@@ -1001,7 +1164,7 @@ class UnifiedView(Adw.Bin):
             return
         self._config.mode = list(SwapMode)[index]
         if self._mode_description:
-            self._mode_description.set_text(SWAP_MODE_DESCRIPTIONS[self._config.mode])
+            self._mode_description.set_text(self._config.mode.description)
         self._update_settings_visibility()
         self._check_config_changed()
 
@@ -1015,13 +1178,13 @@ class UnifiedView(Adw.Bin):
         if self._loading:
             return
         self._config.zswap.max_pool_percent = int(value)
-        self._check_config_changed()
+        self._queue_config_check()
 
     def _on_zram_size_changed(self, value: float) -> None:
         if self._loading:
             return
         self._config.zram.size_percent = int(value)
-        self._check_config_changed()
+        self._queue_config_check()
 
     def _on_zram_alg_changed(self, index: int) -> None:
         if self._loading:
@@ -1033,7 +1196,7 @@ class UnifiedView(Adw.Bin):
         if self._loading:
             return
         self._config.zram.mem_limit_percent = int(value)
-        self._check_config_changed()
+        self._queue_config_check()
 
     def _on_zram_recompress_changed(self, active: bool) -> None:
         if self._loading:
@@ -9,19 +9,22 @@ from __future__ import annotations
 
 import json
 import logging
+from typing import TYPE_CHECKING
 
-import gi
+from biglinux_swap._gi_bootstrap import Adw, Gtk
 
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gtk
-
-from biglinux_swap.config import USER_CONFIG_DIR
+from biglinux_swap.config import user_config_dir
 from biglinux_swap.i18n import _
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = logging.getLogger(__name__)
 
-_WELCOME_SEEN_FILE = USER_CONFIG_DIR / "welcome_seen.json"
+
+def _welcome_seen_file() -> Path:
+    """Return the file recording the welcome dialog preference."""
+    return user_config_dir() / "welcome_seen.json"
 
 
 class WelcomeDialog:
@@ -171,19 +174,15 @@ class WelcomeDialog:
 
         content_box.append(switch_box)
 
-        # --- Close Button ---
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
-        button_box.set_margin_top(18)
-        button_box.set_halign(Gtk.Align.CENTER)
-
+        # --- Close Button (margin/alignment on the button, no wrapper box) ---
         close_btn = Gtk.Button(label=_("Let's Start"))
         close_btn.add_css_class("suggested-action")
         close_btn.add_css_class("pill")
         close_btn.set_size_request(200, 45)
+        close_btn.set_margin_top(18)
+        close_btn.set_halign(Gtk.Align.CENTER)
         close_btn.connect("clicked", lambda _b: self.close())
-
-        button_box.append(close_btn)
-        content_box.append(button_box)
+        content_box.append(close_btn)
 
         scrolled.set_child(content_box)
         self.dialog.set_child(scrolled)
@@ -215,20 +214,19 @@ class WelcomeDialog:
     @staticmethod
     def should_show_welcome() -> bool:
         """Check if the welcome dialog should be shown."""
-        if not _WELCOME_SEEN_FILE.exists():
-            return True
         try:
-            data = json.loads(_WELCOME_SEEN_FILE.read_text(encoding="utf-8"))
+            data = json.loads(_welcome_seen_file().read_bytes())
             return data.get("show_welcome_dialog", True)
         except (json.JSONDecodeError, OSError):
+            # Includes FileNotFoundError on first run
             return True
 
 
 def _save_welcome_preference(show: bool) -> None:
     """Save whether the welcome dialog should appear on startup."""
     try:
-        USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        user_config_dir().mkdir(parents=True, exist_ok=True)
         data = {"show_welcome_dialog": show}
-        _WELCOME_SEEN_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        _welcome_seen_file().write_text(json.dumps(data, indent=2), encoding="utf-8")
     except OSError as e:
         logger.error("Error saving welcome preference: %s", e)
@@ -17,12 +17,7 @@ import threading
 from collections.abc import Callable
 from pathlib import Path
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Gdk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gdk, GLib, Gtk
+from biglinux_swap._gi_bootstrap import Adw, Gdk, GLib, Gtk
 
 from biglinux_swap.config import CONFIG_PATH
 from biglinux_swap.i18n import _
@@ -58,7 +53,7 @@ def apply_config_with_pkexec(
                 "pkexec",
                 "/bin/bash",
                 "-c",
-                f"cp {shlex.quote(tmp_path)} {shlex.quote(str(CONFIG_PATH))} && chmod 644 {shlex.quote(str(CONFIG_PATH))}",
+                f"cp {shlex.quote(tmp_path)} {shlex.quote(CONFIG_PATH)} && chmod 644 {shlex.quote(CONFIG_PATH)}",
             ]
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
             Path(tmp_path).unlink(missing_ok=True)
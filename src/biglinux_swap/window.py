@@ -11,11 +11,7 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import gi
-
-gi.require_version("Gtk", "4.0")
-gi.require_version("Adw", "1")
-from gi.repository import Adw, Gio, Gtk
+from biglinux_swap._gi_bootstrap import Adw, Gio, Gtk
 
 from biglinux_swap.config import APP_NAME, SwapConfig, SwapMode
 from biglinux_swap.i18n import _